@@ -23,9 +23,9 @@ See LICENSE file for full terms.
 """Additional coverage tests for DataGridWidget — fills gaps not in test_datagrid_excel.py."""
 
 import pytest
-from PySide6.QtCore import QEvent, Qt, QTimer
-from PySide6.QtGui import QKeyEvent, QMouseEvent
-from PySide6.QtWidgets import QApplication, QComboBox, QHeaderView, QLineEdit
+from PySide6.QtCore import QEvent, QItemSelectionModel, Qt, QTimer
+from PySide6.QtGui import QColor, QKeyEvent, QMouseEvent, QPalette
+from PySide6.QtWidgets import QApplication, QComboBox, QHeaderView, QLineEdit, QStyleOptionViewItem
 
 from k2widgets import ColumnConfig, DataGridWidget
 
@@ -265,6 +265,26 @@ class TestTabAddsRow:
         assert g.table.rowCount() == before
 
 
+@pytest.fixture
+def checkbox_item_grid(qtbot):
+    """Grid with a plain checkable-item "checkbox" column (no cell widget)."""
+    g = DataGridWidget()
+    g.configure([
+        ColumnConfig("Name",  width=120, editor_type="text", filter_type="text"),
+        ColumnConfig("Flag",  width=60,  editor_type="checkbox",
+                     filter_type="combobox",
+                     filter_options={"items": ["All", "Yes", "No"]},
+                     filter_matcher=lambda fv, cv:
+                         (cv == "true") if fv == "Yes" else (cv == "false")),
+    ])
+    g.add_row(["Alpha", True])
+    g.add_row(["Beta",  False])
+    g.add_row(["Gamma", True])
+    qtbot.addWidget(g)
+    g.show()
+    return g
+
+
 # ---------------------------------------------------------------------------
 # Bulk edit — additional coverage
 # ---------------------------------------------------------------------------
@@ -368,6 +388,31 @@ class TestBulkEditAdditional:
         assert grid.table.item(1, 0).text() == "PROPAGATE"
         assert grid.table.item(2, 0).text() == "PROPAGATE"
 
+    def test_bulk_edit_checkable_item_propagates(self, checkbox_item_grid, qtbot):
+        """Toggling a plain "checkbox" item propagates its check state like a text edit."""
+        table = checkbox_item_grid.table
+        table._captured_selection = {0, 1, 2}
+
+        table.item(0, 1).setCheckState(Qt.CheckState.Unchecked)
+        qtbot.wait(50)
+
+        assert checkbox_item_grid.get_all_data() == [
+            ["Alpha", False], ["Beta", False], ["Gamma", False],
+        ]
+
+    def test_bulk_edit_restores_viewport_updates(self, grid, qtbot):
+        """Repaints are held back only while propagating, then the viewport updates again."""
+        seen = []
+        grid.table.cellChanged.connect(lambda r, c: seen.append(grid.table.viewport().updatesEnabled()))
+
+        grid.table._captured_selection = {0, 1, 2}
+        grid.table.item(0, 1).setText("9")
+        qtbot.wait(50)
+
+        assert seen == [True]
+        assert grid.table.viewport().updatesEnabled()
+        assert [row[1] for row in grid.get_all_data()] == ["9", "9", "9"]
+
 
 # ---------------------------------------------------------------------------
 # Filters
@@ -467,6 +512,15 @@ class TestFilters:
         for row in range(filter_grid.table.rowCount()):
             assert not filter_grid.table.isRowHidden(row)
 
+    def test_filter_matcher_on_checkable_item(self, checkbox_item_grid, qtbot):
+        """Plain "checkbox" items report "true"/"false" to the filter like centered checkboxes."""
+        checkbox_item_grid._filters[1].setCurrentText("Yes")
+        qtbot.wait(50)
+
+        assert not checkbox_item_grid.table.isRowHidden(0)  # Alpha / True  — shown
+        assert checkbox_item_grid.table.isRowHidden(1)       # Beta  / False — hidden
+        assert not checkbox_item_grid.table.isRowHidden(2)  # Gamma / True  — shown
+
 
 # ---------------------------------------------------------------------------
 # Sorting
@@ -564,6 +618,40 @@ class TestBasicOperations:
         assert grid.table.item(last_row, 0).text() == ""
         assert grid.table.item(last_row, 1).text() == ""
 
+    def test_add_rows_appends_all_rows(self, mixed_grid, qtbot):
+        """add_rows() appends every row, widget cells included."""
+        mixed_grid.add_rows([["Delta", False, "B", "x"], ["Epsilon", True, "A", "y"]])
+        assert mixed_grid.table.rowCount() == 5
+        assert mixed_grid.get_row_data(3) == ["Delta", False, "B", "x"]
+        assert mixed_grid.get_row_data(4) == ["Epsilon", True, "A", "y"]
+
+    def test_add_rows_emits_data_changed_once(self, grid, qtbot):
+        """add_rows() emits row_added per row but data_changed only once."""
+        added, changed = [], []
+        grid.row_added.connect(added.append)
+        grid.data_changed.connect(lambda: changed.append(True))
+        grid.add_rows([["D", "4"], ["E", "5"]])
+        assert added == [3, 4]
+        assert changed == [True]
+
+    def test_add_rows_keeps_caller_signal_block(self, grid, qtbot):
+        """add_rows() must not unblock table signals that its caller blocked."""
+        grid.table.blockSignals(True)
+        try:
+            grid.add_rows([["D", "4"], ["E", "5"]])
+            assert grid.table.signalsBlocked()
+        finally:
+            grid.table.blockSignals(False)
+        assert grid.table.rowCount() == 5
+
+    def test_add_rows_applies_active_filter(self, filter_grid, qtbot):
+        """Rows added with add_rows() are hidden when they don't match the active filter."""
+        filter_grid._filters[0].setText("alp")
+        qtbot.wait(50)
+        filter_grid.add_rows([["Alpine", "Y", False], ["Omega", "Z", True]])
+        assert not filter_grid.table.isRowHidden(4)
+        assert filter_grid.table.isRowHidden(5)
+
     def test_remove_selected_rows_single(self, grid, qtbot):
         """Removing a single selected row decrements rowCount by 1."""
         grid.table.setCurrentCell(1, 0)
@@ -585,6 +673,18 @@ class TestBasicOperations:
         assert removed_signal == [0]
         assert changed_signal[0]
 
+    def test_selected_rows_returns_each_row_once(self, grid, qtbot):
+        """selected_rows() reports whole selected rows, not one entry per cell."""
+        sm = grid.table.selectionModel()
+        flags = QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows
+        sm.select(grid.table.model().index(0, 0), flags)
+        sm.select(grid.table.model().index(2, 1), flags)
+        assert grid.table.selected_rows() == {0, 2}
+
+        removed = grid.remove_selected_rows(confirm=False)
+        assert sorted(removed) == [0, 2]
+        assert grid.get_all_data() == [["Beta", "2"]]
+
     def test_remove_nothing_when_nothing_selected(self, grid, qtbot):
         """Calling remove_selected_rows with nothing selected/current returns []."""
         grid.table.clearSelection()
@@ -674,6 +774,44 @@ class TestBasicOperations:
         assert fired[0] >= 1
 
 
+# ---------------------------------------------------------------------------
+# Cell-editable callback
+# ---------------------------------------------------------------------------
+
+class TestCellEditableCallback:
+    def test_rejected_cell_opens_no_editor(self, grid, qtbot):
+        """A cell rejected by the callback must not open an inline editor."""
+        grid.set_cell_editable_callback(1, lambda row: row != 1)
+
+        grid.table.setCurrentCell(1, 1)
+        grid.table.editItem(grid.table.item(1, 1))
+        qtbot.wait(50)
+        assert not grid.table.viewport().findChildren(QLineEdit)
+
+        grid.table.setCurrentCell(0, 1)
+        grid.table.editItem(grid.table.item(0, 1))
+        qtbot.wait(50)
+        assert grid.table.viewport().findChildren(QLineEdit)
+
+    def test_rejected_cell_is_painted_gray(self, grid):
+        """Rejected cells get gray text; other columns and rows keep the default palette."""
+        grid.set_cell_editable_callback(1, lambda row: row != 1)
+        delegate = grid.table._delegate
+        model = grid.table.model()
+
+        def text_color(row, col):
+            option = QStyleOptionViewItem()
+            delegate.initStyleOption(option, model.index(row, col))
+            return option.palette.color(QPalette.ColorRole.Text)
+
+        assert text_color(1, 1) == QColor(128, 128, 128)
+        assert text_color(0, 1) != QColor(128, 128, 128)
+        assert text_color(1, 0) != QColor(128, 128, 128)
+
+        grid.set_cell_editable_callback(1, None)
+        assert text_color(1, 1) != QColor(128, 128, 128)
+
+
 # ---------------------------------------------------------------------------
 # Clipboard — edge cases
 # ---------------------------------------------------------------------------
@@ -818,3 +956,83 @@ class TestConfiguration:
 
         row_data = g.get_row_data(0)
         assert row_data[0] == "FOREIGN"  # get_row_data returns data, not display text
+
+    def test_combobox_data_cells_share_item_model(self, qtbot):
+        """All combobox_data cells of a column share one item model but keep their own selection."""
+        g = DataGridWidget()
+        g.configure([
+            ColumnConfig("Type", editor_type="combobox_data",
+                         editor_options={
+                             "items":      ["Primary Key", "Foreign Key"],
+                             "items_data": ["PRIMARY",     "FOREIGN"],
+                         },
+                         filter_type="none"),
+        ])
+        g.add_row(["PRIMARY"])
+        g.add_row(["FOREIGN"])
+        qtbot.addWidget(g)
+
+        combo0 = g.table.cellWidget(0, 0)
+        combo1 = g.table.cellWidget(1, 0)
+        assert combo0.model() is combo1.model()
+        assert g.get_all_data() == [["PRIMARY"], ["FOREIGN"]]
+
+    def _lazy_grid(self, qtbot):
+        g = DataGridWidget()
+        g.configure([
+            ColumnConfig("Name", editor_type="text", filter_type="none"),
+            ColumnConfig("Type", editor_type="combobox_data_lazy",
+                         editor_options={
+                             "items":      ["", "Primary Key", "Foreign Key"],
+                             "items_data": ["", "PRIMARY",     "FOREIGN"],
+                         },
+                         filter_type="none"),
+        ])
+        g.add_row(["a", "PRIMARY"])
+        g.add_row(["b", "Foreign Key"])
+        g.add_row(["c", "UNKNOWN"])
+        qtbot.addWidget(g)
+        return g
+
+    def test_combobox_data_lazy_cells_are_plain_items(self, qtbot):
+        """combobox_data_lazy cells hold display text and data in an item, with no cell widget."""
+        g = self._lazy_grid(qtbot)
+
+        assert all(g.get_cell_widget(r, 1) is None for r in range(3))
+        assert [g.table.item(r, 1).text() for r in range(3)] == ["Primary Key", "Foreign Key", ""]
+        assert g.get_all_data() == [["a", "PRIMARY"], ["b", "FOREIGN"], ["c", ""]]
+
+        g.set_row_data(2, ["c", "FOREIGN"])
+        g.set_row_data(0, ["a", "UNKNOWN"])  # no match: unchanged, as on a combobox
+        assert g.get_all_data() == [["a", "PRIMARY"], ["b", "FOREIGN"], ["c", "FOREIGN"]]
+
+    def test_combobox_data_lazy_editor_commits_choice(self, qtbot):
+        """Editing opens a combobox over the shared model; picking an item writes it to the cell."""
+        g = self._lazy_grid(qtbot)
+        g.show()
+        changes = []
+        g.table.cellChanged.connect(lambda r, c: changes.append((r, c)))
+
+        g.table.setCurrentCell(0, 1)
+        g.table.editItem(g.table.item(0, 1))
+        editor = g.table.findChild(QComboBox)
+        assert editor is not None
+        assert editor.model() is g.table._delegate._combo_editor_models[1]
+        assert editor.currentData() == "PRIMARY"
+
+        editor.setCurrentIndex(2)
+        editor.activated.emit(2)
+
+        assert g.get_row_data(0) == ["a", "FOREIGN"]
+        assert g.table.item(0, 1).text() == "Foreign Key"
+        assert changes == [(0, 1)]
+
+    def test_combobox_data_lazy_bulk_edit_propagates(self, qtbot):
+        """A combobox_data_lazy change is copied to the captured selection with its data value."""
+        g = self._lazy_grid(qtbot)
+        g.table._captured_selection = {0, 1, 2}
+
+        g.set_row_data(0, ["a", "FOREIGN"])
+
+        assert [row[1] for row in g.get_all_data()] == ["FOREIGN"] * 3
+        assert [g.table.item(r, 1).text() for r in range(3)] == ["Foreign Key"] * 3
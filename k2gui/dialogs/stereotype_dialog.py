@@ -20,19 +20,24 @@ For commercial licensing, contact: sheafraidh@gmail.com
 See LICENSE file for full terms.
 """
 
+import functools
 
-from PySide6.QtGui import QColor
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QColor, QStaticText
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QColorDialog,
     QDialog,
     QFormLayout,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyle,
+    QStyledItemDelegate,
+    QTableView,
     QTabWidget,
     QTextEdit,
     QVBoxLayout,
@@ -41,15 +46,168 @@ from PySide6.QtWidgets import (
 
 from k2core.models.base import Stereotype, StereotypeType
 
+_WHITE = QColor(255, 255, 255)
+_BLACK = QColor(0, 0, 0)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_dark_color(color_hex: str) -> bool:
+    """Check if a color is dark (to determine text color).
+
+    Stereotype palettes are small and repeat on every repaint, so results are
+    memoized by hex string.
+    """
+    color = QColor(color_hex)
+    if not color.isValid():
+        return False
+    # Perceived brightness, scaled by 1000 to stay in integer arithmetic
+    return (color.red() * 299 + color.green() * 587 + color.blue() * 114) < 128000
+
+
+@functools.lru_cache(maxsize=256)
+def _background_color(color_hex: str) -> QColor:
+    """Return a shared QColor for a stereotype background hex string."""
+    return QColor(color_hex)
+
+
+class StereotypeTableModel(QAbstractTableModel):
+    """Read-only table model over a list of stereotypes.
+
+    The model wraps the dialog's stereotype list directly, so the view only
+    asks for the cells it actually paints instead of holding one item per cell.
+    """
+
+    HEADERS = ["Name", "Description", "Background Color", "Preview"]
+
+    def __init__(self, stereotypes: list[Stereotype], parent=None):
+        super().__init__(parent)
+        self._stereotypes = stereotypes
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._stereotypes)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        stereotype = self._stereotypes[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 1:
+                return stereotype.description or ""
+            if column == 2:
+                return stereotype.background_color
+            return stereotype.name
+
+        if role == Qt.ItemDataRole.BackgroundRole and column >= 2:
+            return _background_color(stereotype.background_color)
+
+        if role == Qt.ItemDataRole.UserRole and column == 3:
+            color_hex = stereotype.background_color
+            return stereotype.name, color_hex, _is_dark_color(color_hex)
+
+        if role == Qt.ItemDataRole.ForegroundRole and column == 3:
+            # Set text color to contrast with background
+            return _WHITE if _is_dark_color(stereotype.background_color) else _BLACK
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def refresh(self):
+        """Notify views that the underlying stereotype list has changed."""
+        self.beginResetModel()
+        self.endResetModel()
+
+    def append_stereotype(self, stereotype: Stereotype):
+        """Append a stereotype as a new last row."""
+        row = len(self._stereotypes)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._stereotypes.append(stereotype)
+        self.endInsertRows()
+
+    def replace_stereotype(self, row: int, stereotype: Stereotype):
+        """Replace the stereotype at the given row and repaint only that row."""
+        self._stereotypes[row] = stereotype
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def remove_stereotype(self, row: int):
+        """Remove the stereotype at the given row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._stereotypes[row]
+        self.endRemoveRows()
+
+
+class StereotypePreviewDelegate(QStyledItemDelegate):
+    """Paints the Preview column as the stereotype name on its background color.
+
+    Names are drawn with a QStaticText cached per name, so repaints skip text layout.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._static_texts: dict[str, QStaticText] = {}
+
+    def paint(self, painter, option, index):
+        preview = index.data(Qt.ItemDataRole.UserRole)
+        if not preview:
+            super().paint(painter, option, index)
+            return
+
+        name, color_hex, is_dark = preview
+        static_text = self._static_texts.get(name)
+        if static_text is None:
+            static_text = QStaticText(name)
+            self._static_texts[name] = static_text
+
+        painter.save()
+        painter.fillRect(option.rect, _background_color(color_hex))
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(option.palette.highlight().color())
+            painter.drawRect(option.rect.adjusted(0, 0, -1, -1))
+        painter.setPen(_WHITE if is_dark else _BLACK)
+        painter.setFont(option.font)
+        text_height = static_text.size().height()
+        painter.drawStaticText(
+            option.rect.left() + 4,
+            option.rect.top() + int((option.rect.height() - text_height) / 2),
+            static_text,
+        )
+        painter.restore()
+
 
 class StereotypeDialog(QDialog):
     """Dialog for managing stereotypes."""
 
+    # Tab title and add-button label for each stereotype kind
+    _KIND_LABELS = {
+        StereotypeType.TABLE: ("Table Stereotypes", "Add Table Stereotype"),
+        StereotypeType.COLUMN: ("Column Stereotypes", "Add Column Stereotype"),
+    }
+
     def __init__(self, project=None, parent=None):
         super().__init__(parent)
         self.project = project
         self.table_stereotypes = []
         self.column_stereotypes = []
+        self._stereotypes = {
+            StereotypeType.TABLE: self.table_stereotypes,
+            StereotypeType.COLUMN: self.column_stereotypes,
+        }
+        self._models = {}
+        self._views = {}
+        self._buttons = {}
+
+        # Color picker shared by every edit dialog opened from here, built on
+        # first use
+        self._color_dialog = None
 
         self._setup_ui()
         self._load_data()
@@ -68,15 +226,13 @@ class StereotypeDialog(QDialog):
         # Tab widget
         self.tab_widget = QTabWidget()
 
-        # Table stereotypes tab
-        table_tab = QWidget()
-        self._setup_table_tab(table_tab)
-        self.tab_widget.addTab(table_tab, "Table Stereotypes")
+        for kind, (title, _) in self._KIND_LABELS.items():
+            tab = QWidget()
+            self._setup_stereotype_tab(tab, kind)
+            self.tab_widget.addTab(tab, title)
 
-        # Column stereotypes tab
-        column_tab = QWidget()
-        self._setup_column_tab(column_tab)
-        self.tab_widget.addTab(column_tab, "Column Stereotypes")
+        self.table_stereotypes_table = self._views[StereotypeType.TABLE]
+        self.column_stereotypes_table = self._views[StereotypeType.COLUMN]
 
         layout.addWidget(self.tab_widget)
 
@@ -92,270 +248,172 @@ class StereotypeDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-    def _setup_table_tab(self, tab_widget):
-        """Setup the table stereotypes tab."""
+    def _setup_stereotype_tab(self, tab_widget, kind: StereotypeType):
+        """Setup the stereotypes tab for the given stereotype kind."""
         layout = QVBoxLayout(tab_widget)
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(5)
 
-        # Table stereotypes list
-        self.table_stereotypes_table = QTableWidget()
-        self.table_stereotypes_table.setColumnCount(4)
-        self.table_stereotypes_table.setHorizontalHeaderLabels([
-            "Name", "Description", "Background Color", "Preview"
-        ])
+        # Stereotypes list; the model is attached when the tab is first shown
+        model = StereotypeTableModel(self._stereotypes[kind], self)
+        view = QTableView()
+        view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        view.horizontalHeader().setStretchLastSection(False)
 
-        # Set column widths
-        header = self.table_stereotypes_table.horizontalHeader()
-        self.table_stereotypes_table.setColumnWidth(0, 120)  # Name
-        self.table_stereotypes_table.setColumnWidth(1, 200)  # Description
-        self.table_stereotypes_table.setColumnWidth(2, 120)  # Background Color
-        self.table_stereotypes_table.setColumnWidth(3, 100)  # Preview
-        header.setStretchLastSection(False)
-
-        layout.addWidget(self.table_stereotypes_table)
-
-        # Table buttons
-        table_buttons = QHBoxLayout()
-        self.add_table_stereotype_btn = QPushButton("Add Table Stereotype")
-        self.edit_table_stereotype_btn = QPushButton("Edit")
-        self.remove_table_stereotype_btn = QPushButton("Remove")
-
-        table_buttons.addWidget(self.add_table_stereotype_btn)
-        table_buttons.addWidget(self.edit_table_stereotype_btn)
-        table_buttons.addWidget(self.remove_table_stereotype_btn)
-        table_buttons.addStretch()
-
-        layout.addLayout(table_buttons)
-
-    def _setup_column_tab(self, tab_widget):
-        """Setup the column stereotypes tab."""
-        layout = QVBoxLayout(tab_widget)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
+        # All rows share one fixed height, so Qt never asks for per-row size hints
+        vertical_header = view.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(vertical_header.fontMetrics().height() + 6)
+        vertical_header.setVisible(False)
+        view.setItemDelegateForColumn(3, StereotypePreviewDelegate(view))
 
-        # Column stereotypes list
-        self.column_stereotypes_table = QTableWidget()
-        self.column_stereotypes_table.setColumnCount(4)
-        self.column_stereotypes_table.setHorizontalHeaderLabels([
-            "Name", "Description", "Background Color", "Preview"
-        ])
-
-        # Set column widths
-        header = self.column_stereotypes_table.horizontalHeader()
-        self.column_stereotypes_table.setColumnWidth(0, 120)  # Name
-        self.column_stereotypes_table.setColumnWidth(1, 200)  # Description
-        self.column_stereotypes_table.setColumnWidth(2, 120)  # Background Color
-        self.column_stereotypes_table.setColumnWidth(3, 100)  # Preview
-        header.setStretchLastSection(False)
+        layout.addWidget(view)
 
-        layout.addWidget(self.column_stereotypes_table)
+        # Buttons
+        buttons_layout = QHBoxLayout()
+        add_btn = QPushButton(self._KIND_LABELS[kind][1])
+        edit_btn = QPushButton("Edit")
+        remove_btn = QPushButton("Remove")
 
-        # Column buttons
-        column_buttons = QHBoxLayout()
-        self.add_column_stereotype_btn = QPushButton("Add Column Stereotype")
-        self.edit_column_stereotype_btn = QPushButton("Edit")
-        self.remove_column_stereotype_btn = QPushButton("Remove")
+        buttons_layout.addWidget(add_btn)
+        buttons_layout.addWidget(edit_btn)
+        buttons_layout.addWidget(remove_btn)
+        buttons_layout.addStretch()
 
-        column_buttons.addWidget(self.add_column_stereotype_btn)
-        column_buttons.addWidget(self.edit_column_stereotype_btn)
-        column_buttons.addWidget(self.remove_column_stereotype_btn)
-        column_buttons.addStretch()
+        layout.addLayout(buttons_layout)
 
-        layout.addLayout(column_buttons)
+        self._models[kind] = model
+        self._views[kind] = view
+        self._buttons[kind] = (add_btn, edit_btn, remove_btn)
 
     def _load_data(self):
         """Load stereotype data from project."""
         if self.project and hasattr(self.project, 'stereotypes'):
-            for stereotype in self.project.stereotypes:
-                if stereotype.stereotype_type == StereotypeType.TABLE:
-                    self.table_stereotypes.append(stereotype)
-                else:
-                    self.column_stereotypes.append(stereotype)
-
-        self._refresh_table_stereotypes()
-        self._refresh_column_stereotypes()
-
-    def _refresh_table_stereotypes(self):
-        """Refresh the table stereotypes list."""
-        self.table_stereotypes_table.setRowCount(len(self.table_stereotypes))
-
-        for row, stereotype in enumerate(self.table_stereotypes):
-            # Name
-            self.table_stereotypes_table.setItem(row, 0, QTableWidgetItem(stereotype.name))
-
-            # Description
-            description = stereotype.description or ""
-            self.table_stereotypes_table.setItem(row, 1, QTableWidgetItem(description))
-
-            # Background Color
-            color_item = QTableWidgetItem(stereotype.background_color)
-            color_item.setBackground(QColor(stereotype.background_color))
-            self.table_stereotypes_table.setItem(row, 2, color_item)
-
-            # Preview
-            preview_item = QTableWidgetItem(stereotype.name)
-            preview_item.setBackground(QColor(stereotype.background_color))
-            # Set text color to contrast with background
-            if self._is_dark_color(stereotype.background_color):
-                preview_item.setForeground(QColor("#FFFFFF"))
-            else:
-                preview_item.setForeground(QColor("#000000"))
-            self.table_stereotypes_table.setItem(row, 3, preview_item)
-
-    def _refresh_column_stereotypes(self):
-        """Refresh the column stereotypes list."""
-        self.column_stereotypes_table.setRowCount(len(self.column_stereotypes))
-
-        for row, stereotype in enumerate(self.column_stereotypes):
-            # Name
-            self.column_stereotypes_table.setItem(row, 0, QTableWidgetItem(stereotype.name))
-
-            # Description
-            description = stereotype.description or ""
-            self.column_stereotypes_table.setItem(row, 1, QTableWidgetItem(description))
-
-            # Background Color
-            color_item = QTableWidgetItem(stereotype.background_color)
-            color_item.setBackground(QColor(stereotype.background_color))
-            self.column_stereotypes_table.setItem(row, 2, color_item)
-
-            # Preview
-            preview_item = QTableWidgetItem(stereotype.name)
-            preview_item.setBackground(QColor(stereotype.background_color))
-            # Set text color to contrast with background
-            if self._is_dark_color(stereotype.background_color):
-                preview_item.setForeground(QColor("#FFFFFF"))
-            else:
-                preview_item.setForeground(QColor("#000000"))
-            self.column_stereotypes_table.setItem(row, 3, preview_item)
-
-    def _is_dark_color(self, color_hex: str) -> bool:
-        """Check if a color is dark (to determine text color)."""
-        try:
-            color = QColor(color_hex)
-            # Calculate perceived brightness
-            brightness = (color.red() * 0.299 + color.green() * 0.587 + color.blue() * 0.114)
-            return brightness < 128
-        except Exception:
-            return False
-
-    def _connect_signals(self):
-        """Connect signals."""
-        self.ok_button.clicked.connect(self._on_ok)
-        self.cancel_button.clicked.connect(self.reject)
+            # Extend in place: the table models hold references to these lists
+            stereotypes = self.project.stereotypes
+            table_type = StereotypeType.TABLE
+            self.table_stereotypes.extend([s for s in stereotypes if s.stereotype_type is table_type])
+            self.column_stereotypes.extend([s for s in stereotypes if s.stereotype_type is not table_type])
+
+        self._on_tab_changed(self.tab_widget.currentIndex())
+
+    def _ensure_tab_loaded(self, kind: StereotypeType):
+        """Attach the model to the view of the given kind on first use."""
+        view = self._views[kind]
+        if view.model() is not None:
+            return
 
-        # Table stereotype buttons
-        self.add_table_stereotype_btn.clicked.connect(self._add_table_stereotype)
-        self.edit_table_stereotype_btn.clicked.connect(self._edit_table_stereotype)
-        self.remove_table_stereotype_btn.clicked.connect(self._remove_table_stereotype)
+        view.setModel(self._models[kind])
 
-        # Column stereotype buttons
-        self.add_column_stereotype_btn.clicked.connect(self._add_column_stereotype)
-        self.edit_column_stereotype_btn.clicked.connect(self._edit_column_stereotype)
-        self.remove_column_stereotype_btn.clicked.connect(self._remove_column_stereotype)
+        # Set column widths
+        view.setColumnWidth(0, 120)  # Name
+        view.setColumnWidth(1, 200)  # Description
+        view.setColumnWidth(2, 120)  # Background Color
+        view.setColumnWidth(3, 100)  # Preview
 
-        # Double-click to edit
-        self.table_stereotypes_table.itemDoubleClicked.connect(self._edit_table_stereotype)
-        self.column_stereotypes_table.itemDoubleClicked.connect(self._edit_column_stereotype)
+    def _on_tab_changed(self, index: int):
+        """Populate a stereotype tab the first time it becomes visible."""
+        kinds = list(self._KIND_LABELS)
+        if 0 <= index < len(kinds):
+            self._ensure_tab_loaded(kinds[index])
 
-    def _add_table_stereotype(self):
-        """Add a new table stereotype."""
-        dialog = StereotypeEditDialog(StereotypeType.TABLE, parent=self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            stereotype = dialog.get_stereotype()
-            self.table_stereotypes.append(stereotype)
-            self._refresh_table_stereotypes()
-
-    def _edit_table_stereotype(self):
-        """Edit the selected table stereotype."""
-        current_row = self.table_stereotypes_table.currentRow()
-        if current_row >= 0 and current_row < len(self.table_stereotypes):
-            stereotype = self.table_stereotypes[current_row]
-            dialog = StereotypeEditDialog(StereotypeType.TABLE, stereotype, parent=self)
-            if dialog.exec() == QDialog.DialogCode.Accepted:
-                updated_stereotype = dialog.get_stereotype()
-                self.table_stereotypes[current_row] = updated_stereotype
-                self._refresh_table_stereotypes()
-
-    def _remove_table_stereotype(self):
-        """Remove the selected table stereotype."""
-        current_row = self.table_stereotypes_table.currentRow()
-        if current_row >= 0 and current_row < len(self.table_stereotypes):
-            stereotype = self.table_stereotypes[current_row]
-            reply = QMessageBox.question(
-                self, "Remove Stereotype",
-                f"Are you sure you want to remove the table stereotype '{stereotype.name}'?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            if reply == QMessageBox.StandardButton.Yes:
-                del self.table_stereotypes[current_row]
-                self._refresh_table_stereotypes()
-
-    def _add_column_stereotype(self):
-        """Add a new column stereotype."""
-        dialog = StereotypeEditDialog(StereotypeType.COLUMN, parent=self)
+    def _connect_signals(self):
+        """Connect signals."""
+        connections = [
+            (self.ok_button.clicked, self._on_ok),
+            (self.cancel_button.clicked, self.reject),
+            (self.tab_widget.currentChanged, self._on_tab_changed),
+        ]
+        for kind, (add_btn, edit_btn, remove_btn) in self._buttons.items():
+            connections += [
+                (add_btn.clicked, functools.partial(self._add_stereotype, kind)),
+                (edit_btn.clicked, functools.partial(self._edit_stereotype, kind)),
+                (remove_btn.clicked, functools.partial(self._remove_stereotype, kind)),
+                # Double-click to edit; the clicked index is the current one
+                (self._views[kind].doubleClicked, lambda _index, k=kind: self._edit_stereotype(k)),
+            ]
+
+        for signal, slot in connections:
+            signal.connect(slot)
+
+    def _get_color_dialog(self) -> QColorDialog:
+        """Return the shared color picker, creating it on first use."""
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+            self._color_dialog.setWindowTitle("Choose Stereotype Color")
+        return self._color_dialog
+
+    def _add_stereotype(self, kind: StereotypeType):
+        """Add a new stereotype of the given kind."""
+        dialog = _EDIT_DIALOGS[kind](parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            stereotype = dialog.get_stereotype()
-            self.column_stereotypes.append(stereotype)
-            self._refresh_column_stereotypes()
-
-    def _edit_column_stereotype(self):
-        """Edit the selected column stereotype."""
-        current_row = self.column_stereotypes_table.currentRow()
-        if current_row >= 0 and current_row < len(self.column_stereotypes):
-            stereotype = self.column_stereotypes[current_row]
-            dialog = StereotypeEditDialog(StereotypeType.COLUMN, stereotype, parent=self)
+            self._models[kind].append_stereotype(dialog.get_stereotype())
+
+    def _edit_stereotype(self, kind: StereotypeType):
+        """Edit the selected stereotype of the given kind."""
+        stereotypes = self._stereotypes[kind]
+        current_row = self._views[kind].currentIndex().row()
+        if current_row >= 0 and current_row < len(stereotypes):
+            stereotype = stereotypes[current_row]
+            dialog = _EDIT_DIALOGS[kind](stereotype, parent=self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
-                updated_stereotype = dialog.get_stereotype()
-                self.column_stereotypes[current_row] = updated_stereotype
-                self._refresh_column_stereotypes()
-
-    def _remove_column_stereotype(self):
-        """Remove the selected column stereotype."""
-        current_row = self.column_stereotypes_table.currentRow()
-        if current_row >= 0 and current_row < len(self.column_stereotypes):
-            stereotype = self.column_stereotypes[current_row]
+                self._models[kind].replace_stereotype(current_row, dialog.get_stereotype())
+
+    def _remove_stereotype(self, kind: StereotypeType):
+        """Remove the selected stereotype of the given kind."""
+        stereotypes = self._stereotypes[kind]
+        current_row = self._views[kind].currentIndex().row()
+        if current_row >= 0 and current_row < len(stereotypes):
+            stereotype = stereotypes[current_row]
             reply = QMessageBox.question(
                 self, "Remove Stereotype",
-                f"Are you sure you want to remove the column stereotype '{stereotype.name}'?",
+                f"Are you sure you want to remove the {kind.value} stereotype '{stereotype.name}'?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             if reply == QMessageBox.StandardButton.Yes:
-                del self.column_stereotypes[current_row]
-                self._refresh_column_stereotypes()
+                self._models[kind].remove_stereotype(current_row)
 
     def _on_ok(self):
         """Handle OK button click."""
         # Update project stereotypes
         if self.project:
-            all_stereotypes = self.table_stereotypes + self.column_stereotypes
-            self.project.stereotypes = all_stereotypes
+            self.project.stereotypes = self.get_stereotypes()
 
         self.accept()
 
     def get_stereotypes(self):
         """Get all stereotypes."""
-        return self.table_stereotypes + self.column_stereotypes
+        return [*self.table_stereotypes, *self.column_stereotypes]
 
 
 class StereotypeEditDialog(QDialog):
-    """Dialog for editing a single stereotype."""
+    """Dialog for editing a single stereotype.
 
-    def __init__(self, stereotype_type: StereotypeType, stereotype: Stereotype = None, parent=None):
+    Use TableStereotypeEditDialog or ColumnStereotypeEditDialog, which fix the
+    stereotype type, its label and default color.
+    """
+
+    _TYPE: StereotypeType
+    _TYPE_LABEL: str
+    _DEFAULT_COLOR: str
+
+    def __init__(self, stereotype: Stereotype = None, parent=None):
         super().__init__(parent)
-        self.stereotype_type = stereotype_type
+        self.stereotype_type = self._TYPE
         self.stereotype = stereotype
         self.is_edit_mode = stereotype is not None
 
+        # Own color picker, only used when not opened from a StereotypeDialog
+        self._color_dialog = None
+
         self._setup_ui()
         self._load_data()
         self._connect_signals()
 
     def _setup_ui(self):
         """Setup the UI components."""
-        type_name = "Table" if self.stereotype_type == StereotypeType.TABLE else "Column"
-        title = f"Edit {type_name} Stereotype" if self.is_edit_mode else f"Add {type_name} Stereotype"
+        title = f"Edit {self._TYPE_LABEL} Stereotype" if self.is_edit_mode else f"Add {self._TYPE_LABEL} Stereotype"
         self.setWindowTitle(title)
         self.setModal(True)
         self.resize(400, 250)
@@ -413,9 +471,8 @@ class StereotypeEditDialog(QDialog):
         layout.addLayout(button_layout)
 
         # Default color
-        default_color = "#4C4C4C" if self.stereotype_type == StereotypeType.TABLE else "#808080"
-        self.current_color = default_color
-        self._set_color_preview(default_color)
+        self.current_color = self._DEFAULT_COLOR
+        self._set_color_preview(self._DEFAULT_COLOR)
 
     def _load_data(self):
         """Load data if in edit mode."""
@@ -437,11 +494,24 @@ class StereotypeEditDialog(QDialog):
         self.cancel_button.clicked.connect(self.reject)
         self.color_button.clicked.connect(self._choose_color)
 
+    def _get_color_dialog(self) -> QColorDialog:
+        """Return the owning StereotypeDialog's color picker, or this dialog's own."""
+        owner = self.parent()
+        if isinstance(owner, StereotypeDialog):
+            return owner._get_color_dialog()
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+            self._color_dialog.setWindowTitle("Choose Stereotype Color")
+        return self._color_dialog
+
     def _choose_color(self):
         """Open color picker dialog."""
-        current_color = QColor(self.current_color)
-        color = QColorDialog.getColor(current_color, self, "Choose Stereotype Color")
+        dialog = self._get_color_dialog()
+        dialog.setCurrentColor(QColor(self.current_color))
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
 
+        color = dialog.currentColor()
         if color.isValid():
             self.current_color = color.name()
             self._set_color_preview(self.current_color)
@@ -468,3 +538,26 @@ class StereotypeEditDialog(QDialog):
             description=description,
             background_color=self.current_color
         )
+
+
+class TableStereotypeEditDialog(StereotypeEditDialog):
+    """Dialog for editing a single table stereotype."""
+
+    _TYPE = StereotypeType.TABLE
+    _TYPE_LABEL = "Table"
+    _DEFAULT_COLOR = "#4C4C4C"
+
+
+class ColumnStereotypeEditDialog(StereotypeEditDialog):
+    """Dialog for editing a single column stereotype."""
+
+    _TYPE = StereotypeType.COLUMN
+    _TYPE_LABEL = "Column"
+    _DEFAULT_COLOR = "#808080"
+
+
+# Edit dialog class for each stereotype kind
+_EDIT_DIALOGS = {
+    StereotypeType.TABLE: TableStereotypeEditDialog,
+    StereotypeType.COLUMN: ColumnStereotypeEditDialog,
+}
@@ -22,16 +22,20 @@ See LICENSE file for full terms.
 
 
 import copy
+import re
 import warnings
+from contextlib import contextmanager
+from sys import intern
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer, Slot
+from PySide6.QtGui import QColor, QPalette
 from PySide6.QtWidgets import (
     QCheckBox,
     QColorDialog,
     QComboBox,
     QDialog,
     QFormLayout,
+    QFrame,
     QHBoxLayout,
     QHeaderView,
     QLabel,
@@ -53,10 +57,24 @@ from k2widgets import ColumnConfig, DataGridWidget
 
 logger = logging.getLogger(__name__)
 
+# Separator of the comma-separated column lists typed into the keys and indexes grids
+_COLUMN_LIST_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+def _split_column_list(text: str) -> list[str]:
+    """Split a comma-separated column list, dropping whitespace and empty entries."""
+    return [name for name in _COLUMN_LIST_SEPARATOR.split(text.strip()) if name] if text else []
+
 
 class TableDialog(QDialog):
     """Dialog for creating and editing table objects."""
 
+    # Color used when the table has no stereotype or an unknown one
+    _DEFAULT_TABLE_COLOR = "#464646"
+
+    # Color preview tooltip, filled with the hex color
+    _COLOR_PREVIEW_TOOLTIP = "Current color: {}"
+
     def __init__(self, table: Table = None, owners: list = None, selected_owner: str = None,
                  project=None, parent=None):
         super().__init__(parent)
@@ -74,6 +92,18 @@ class TableDialog(QDialog):
         if self.table:
             self._backup_table_state()
 
+        # Columns grid is filled on the first visit to the Columns tab
+        self._columns_loaded = False
+
+        # MainWindow ancestor, resolved on first use
+        self._main_window = None
+
+        # Table stereotype whose color was last applied
+        self._last_table_stereotype = None
+
+        # Color picker, built on first use and reused for this dialog
+        self._color_dialog = None
+
         self._setup_ui()
         self._load_data()
         self._connect_signals()
@@ -93,6 +123,12 @@ class TableDialog(QDialog):
         if not hasattr(self, 'columns_grid') or not hasattr(self.columns_grid, 'table') or self.columns_grid.table is None:
             return columns
 
+        # Columns tab not visited yet: the grid is still empty, use the table's columns
+        if not self._columns_loaded:
+            if self.table:
+                columns = [column.name for column in self.table.columns if column.name]
+            return columns
+
         # Get columns from the grid (includes unsaved changes)
         for row in range(self.columns_grid.table.rowCount()):
             name_item = self.columns_grid.get_cell_item(row, 0)
@@ -121,6 +157,20 @@ class TableDialog(QDialog):
             'indexes': copy.deepcopy(self.table.indexes)
         }
 
+    def _table_changed(self) -> bool:
+        """Return whether the table differs from its state when the dialog was opened."""
+        if not self._original_table_state:
+            return True  # New table
+
+        def comparable(value):
+            # Keys and indexes are rebuilt from the grids with fresh GUIDs; compare their content
+            if isinstance(value, list):
+                return [item.model_dump(exclude={'guid'}) for item in value]
+            return value
+
+        return any(comparable(getattr(self.table, attribute)) != comparable(value)
+                   for attribute, value in self._original_table_state.items())
+
     def _restore_table_state(self):
         """Restore the original table state when Cancel is clicked."""
         if not self.table or not self._original_table_state:
@@ -299,7 +349,14 @@ class TableDialog(QDialog):
         form_layout.addRow("Name *:", self.name_edit)
 
         self.owner_combo = QComboBox()
-        self.owner_combo.addItems([owner.name for owner in self.owners])
+        self._owner_names = [owner.name for owner in self.owners]
+        # Owner name -> combo index / owner, first occurrence wins like findText()
+        self._owner_index = {}
+        self._owners_by_name = {}
+        for index, owner in enumerate(self.owners):
+            self._owner_index.setdefault(owner.name, index)
+            self._owners_by_name.setdefault(owner.name, owner)
+        self.owner_combo.addItems(self._owner_names)
         form_layout.addRow("Owner *:", self.owner_combo)
 
         self.tablespace_edit = QLineEdit()
@@ -316,8 +373,17 @@ class TableDialog(QDialog):
         self.color_button.setFixedWidth(100)
         self.color_preview = QLabel()
         self.color_preview.setFixedSize(50, 30)
-        self.color_preview.setStyleSheet("border: 1px solid black; background-color: #FFFFFF;")
+        # Plain black box filled from the palette; no stylesheet to re-parse on every color change
+        self.color_preview.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Plain)
+        self.color_preview.setLineWidth(1)
+        self.color_preview.setAutoFillBackground(True)
+        preview_palette = self.color_preview.palette()
+        preview_palette.setColor(QPalette.ColorRole.WindowText, QColor("black"))
+        preview_palette.setColor(QPalette.ColorRole.Window, QColor("#FFFFFF"))
+        self.color_preview.setPalette(preview_palette)
         self.color_preview.setToolTip("Current color")
+        # Color last applied through _set_color, used to skip re-applying the same palette
+        self._preview_color = None
         color_layout.addWidget(self.color_button)
         color_layout.addWidget(self.color_preview)
         color_layout.addStretch()
@@ -374,22 +440,22 @@ class TableDialog(QDialog):
 
     def _configure_columns_grid(self):
         """Configure the columns grid with column definitions."""
-        # Get available domains
+        # Get available domains; combo items show and store the same name,
+        # so one list serves as both items and items_data
         domain_items = [""]
-        domain_items_data = [""]
+        # Domain name -> domain, first definition wins like the combobox lookup
+        self._domains_by_name = {}
         if self.project and hasattr(self.project, 'domains'):
             for domain in self.project.domains:
                 domain_items.append(domain.name)
-                domain_items_data.append(domain.name)
+                self._domains_by_name.setdefault(domain.name, domain)
+        has_domains = bool(self._domains_by_name)
 
         # Get available stereotypes
         stereotype_items = [""]
-        stereotype_items_data = [""]
         if self.project and hasattr(self.project, 'stereotypes'):
-            for stereotype in self.project.stereotypes:
-                if stereotype.stereotype_type.value == 'column':
-                    stereotype_items.append(stereotype.name)
-                    stereotype_items_data.append(stereotype.name)
+            stereotype_items.extend(stereotype.name for stereotype in self.project.stereotypes
+                                    if stereotype.stereotype_type == StereotypeType.COLUMN)
 
         # Define columns
         columns = [
@@ -411,7 +477,7 @@ class TableDialog(QDialog):
                 name="Nullable",
                 width=80,
                 resize_mode=QHeaderView.ResizeMode.Fixed,
-                editor_type="checkbox_centered",
+                editor_type="checkbox",
                 filter_type="combobox",
                 filter_options={'items': ['All', 'Nullable', 'Not Nullable']},
                 filter_matcher=lambda fv, cv: (cv == "true") if fv == "Nullable" else (cv == "false"),
@@ -434,8 +500,10 @@ class TableDialog(QDialog):
                 name="Domain",
                 width=120,
                 resize_mode=QHeaderView.ResizeMode.Interactive,
-                editor_type="combobox_data",
-                editor_options={'items': domain_items, 'items_data': domain_items_data},
+                # The domain combobox only exists while a cell is edited; without
+                # domains there is nothing to pick and the cells stay plain text
+                editor_type="combobox_data_lazy" if has_domains else "text",
+                editor_options={'items': domain_items},
                 filter_type="combobox",
                 filter_options={'items': ['All', 'No Domain'] + domain_items[1:], 'editable': True},
                 filter_matcher=lambda fv, cv: (not cv) if fv == "No Domain" else (cv == fv.lower()),
@@ -445,7 +513,7 @@ class TableDialog(QDialog):
                 width=120,
                 resize_mode=QHeaderView.ResizeMode.Interactive,
                 editor_type="combobox_data",
-                editor_options={'items': stereotype_items, 'items_data': stereotype_items_data},
+                editor_options={'items': stereotype_items},
                 filter_type="combobox",
                 filter_options={'items': ['All', 'No Stereotype'] + stereotype_items[1:], 'editable': True},
                 filter_matcher=lambda fv, cv: (not cv) if fv == "No Stereotype" else (cv == fv.lower()),
@@ -462,8 +530,11 @@ class TableDialog(QDialog):
             show_move_buttons=True
         )
 
-        # Set custom cell setup callback for domain-related functionality
-        self.columns_grid.set_cell_setup_callback(self._setup_column_cell)
+        # Data type follows the domain, so it is read-only while a domain is selected
+        self.columns_grid.set_cell_editable_callback(1, self._is_data_type_editable)
+        if not has_domains:
+            # Plain empty Domain cells must not be typed into
+            self.columns_grid.set_cell_editable_callback(5, lambda row: False)
 
         # Connect signals
         self.columns_grid.data_changed.connect(self._on_columns_changed)
@@ -471,36 +542,10 @@ class TableDialog(QDialog):
         # Store reference to the table for compatibility
         self.columns_table = self.columns_grid.table
 
-    def _setup_column_cell(self, row: int, col: int, value):
-        """Custom cell setup for columns grid."""
-        # Column 5 is Domain - set up domain change handler
-        if col == 5:
-            domain_combo = self.columns_grid.get_cell_widget(row, col)
-            if domain_combo and isinstance(domain_combo, QComboBox):
-                # Disconnect any existing connections
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore", RuntimeWarning)
-                    domain_combo.currentTextChanged.disconnect()
-                # Connect to domain change handler
-                domain_combo.currentTextChanged.connect(
-                    lambda text, r=row: self._on_domain_changed(r, text)
-                )
-                # Update data type editability based on current domain
-                self._update_data_type_editability(row, value)
-
-        # Column 6 is Stereotype - set up stereotype change handler
-        elif col == 6:
-            stereotype_combo = self.columns_grid.get_cell_widget(row, col)
-            if stereotype_combo and isinstance(stereotype_combo, QComboBox):
-                # Disconnect any existing connections
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore", RuntimeWarning)
-                    stereotype_combo.currentTextChanged.disconnect()
-                # Connect to stereotype change handler
-                stereotype_combo.currentTextChanged.connect(
-                    lambda text, r=row: self._on_stereotype_changed(r, text)
-                )
+        # Domain cells are plain items, so their changes arrive through cellChanged
+        self.columns_table.cellChanged.connect(self._on_columns_cell_changed)
 
+    @Slot()
     def _on_columns_changed(self):
         """Handle columns data change."""
         # This could be used for tracking modifications
@@ -585,7 +630,7 @@ class TableDialog(QDialog):
                 name="Index",
                 width=60,
                 resize_mode=QHeaderView.ResizeMode.Fixed,
-                editor_type="checkbox_centered",
+                editor_type="checkbox",
                 filter_type="combobox",
                 filter_options={'items': ['All', 'Has Index', 'No Index']},
                 filter_matcher=lambda fv, cv: (cv == "true") if fv == "Has Index" else (cv != "true"),
@@ -642,17 +687,12 @@ class TableDialog(QDialog):
         self.indexes_grid = DataGridWidget()
 
         # Get all unique tablespaces from owners
-        tablespace_items = [""]  # Empty option
-        if self.owners:
-            tablespaces = set()
-            for owner in self.owners:
-                if owner.default_tablespace:
-                    tablespaces.add(owner.default_tablespace)
-                if owner.temp_tablespace:
-                    tablespaces.add(owner.temp_tablespace)
-                if owner.default_index_tablespace:
-                    tablespaces.add(owner.default_index_tablespace)
-            tablespace_items.extend(sorted(tablespaces))
+        tablespace_items = [""] + sorted({  # Empty option first
+            tablespace
+            for owner in self.owners
+            for tablespace in (owner.default_tablespace, owner.temp_tablespace, owner.default_index_tablespace)
+            if tablespace
+        })
 
         # Get columns from the table object if in edit mode, otherwise empty list
         available_columns = []
@@ -710,14 +750,20 @@ class TableDialog(QDialog):
 
     def _populate_stereotypes(self):
         """Populate stereotype combo with project stereotypes."""
-        self.stereotype_combo.clear()
-        self.stereotype_combo.addItem("")  # Empty option
+        names = [""]  # Empty option
+        # Stereotype name -> background color / combo index, first definition wins
+        self._table_stereotype_colors = {}
+        self._table_stereotype_index = {"": 0}
 
         if self.project and hasattr(self.project, 'stereotypes'):
-            table_stereotypes = [s for s in self.project.stereotypes
-                               if s.stereotype_type == StereotypeType.TABLE]
-            for stereotype in table_stereotypes:
-                self.stereotype_combo.addItem(stereotype.name)
+            for stereotype in self.project.stereotypes:
+                if stereotype.stereotype_type is StereotypeType.TABLE:
+                    self._table_stereotype_colors.setdefault(stereotype.name, stereotype.background_color)
+                    self._table_stereotype_index.setdefault(stereotype.name, len(names))
+                    names.append(stereotype.name)
+
+        self.stereotype_combo.clear()
+        self.stereotype_combo.addItems(names)
 
     def _load_data(self):
         """Load data if in edit mode."""
@@ -727,20 +773,24 @@ class TableDialog(QDialog):
         if self.is_edit_mode and self.table:
             self.name_edit.setText(self.table.name)
 
-            # Set owner
-            owner_index = self.owner_combo.findText(self.table.owner)
-            if owner_index >= 0:
-                self.owner_combo.setCurrentIndex(owner_index)
+            # Selecting owner/stereotype must not trigger the stereotype color handler;
+            # the stored table color is applied explicitly below
+            with QSignalBlocker(self.owner_combo), QSignalBlocker(self.stereotype_combo):
+                # Set owner
+                owner_index = self._owner_index.get(self.table.owner, -1)
+                if owner_index >= 0:
+                    self.owner_combo.setCurrentIndex(owner_index)
+
+                self.stereotype_combo.setCurrentIndex(
+                    self._table_stereotype_index.get(self.table.stereotype or "", 0))
 
             self.tablespace_edit.setText(self.table.tablespace or "")
-            self.stereotype_combo.setCurrentText(self.table.stereotype or "")
             self._set_color(self.table.color or "#FFFFFF")
             self._color_manually_set = bool(self.table.color)  # Mark as manually set if table has a specific color
             self.editionable_check.setChecked(self.table.editionable)
             self.comment_edit.setPlainText(self.table.comment or "")
 
-            # Load columns
-            self._load_columns()
+            # Columns are loaded when the Columns tab is first shown
 
             # Load keys
             self._load_keys()
@@ -751,27 +801,71 @@ class TableDialog(QDialog):
             # Name is now editable in edit mode (removed read-only restriction)
         elif self.selected_owner:
             # Pre-select owner in add mode
-            owner_index = self.owner_combo.findText(self.selected_owner)
+            owner_index = self._owner_index.get(self.selected_owner, -1)
             if owner_index >= 0:
-                self.owner_combo.setCurrentIndex(owner_index)
+                with QSignalBlocker(self.owner_combo):
+                    self.owner_combo.setCurrentIndex(owner_index)
+
+    @contextmanager
+    def _bulk_grid_update(self, grid):
+        """Suspend repaints, sorting, grid and cell signals and column auto-sizing while filling a grid."""
+        table = grid.table
+        header = table.horizontalHeader()
+        # Stretch/ResizeToContents sections are laid out again after every inserted row;
+        # hold them at their current width and restore the mode once at the end
+        frozen_sections = {}
+        for section in range(header.count()):
+            mode = header.sectionResizeMode(section)
+            if mode in (QHeaderView.ResizeMode.Stretch, QHeaderView.ResizeMode.ResizeToContents):
+                frozen_sections[section] = mode
+                header.setSectionResizeMode(section, QHeaderView.ResizeMode.Fixed)
+        sorting_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        grid.blockSignals(True)
+        # Per-cell cellChanged handlers have nothing to do for freshly inserted rows
+        table.blockSignals(True)
+        try:
+            yield
+        finally:
+            table.blockSignals(False)
+            grid.blockSignals(False)
+            table.setSortingEnabled(sorting_enabled)
+            for section, mode in frozen_sections.items():
+                header.setSectionResizeMode(section, mode)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+
+    def _ensure_columns_loaded(self):
+        """Fill the columns grid the first time it is needed."""
+        if self._columns_loaded:
+            return
+        self._columns_loaded = True
+        if self.is_edit_mode:
+            self._load_columns()
 
     def _load_columns(self):
         """Load columns into the grid."""
         if not self.table:
             return
 
-        self.columns_grid.clear_data()
-
-        for column in self.table.columns:
-            # Add row with column data
-            self.columns_grid.add_row([
-                column.name,
-                column.data_type,
-                column.nullable,
-                column.default or "",
-                column.comment or "",
-                column.domain or "",
-                column.stereotype or ""
+        domains_by_name = self._domains_by_name
+        with self._bulk_grid_update(self.columns_grid):
+            self.columns_grid.clear_data()
+
+            # Add rows with column data; a domain the project no longer defines
+            # is dropped, whether the Domain column is a combobox or plain text
+            self.columns_grid.add_rows([
+                [
+                    column.name,
+                    column.data_type,
+                    column.nullable,
+                    column.default or "",
+                    column.comment or "",
+                    column.domain if column.domain in domains_by_name else "",
+                    column.stereotype or ""
+                ]
+                for column in self.table.columns
             ])
 
     def _load_keys(self):
@@ -782,37 +876,41 @@ class TableDialog(QDialog):
         # Clear existing rows
         self.keys_grid.clear_data()
 
-        # Add keys from table
-        for key in self.table.keys:
-            # Convert key to row data
-            columns_str = ", ".join(key.columns) if key.columns else ""
-            ref_columns_str = ", ".join(key.referenced_columns) if key.referenced_columns else ""
+        # Add keys from table; row_added stays quiet, Referenced Table signals are wired once below
+        rows = []
+        with self._bulk_grid_update(self.keys_grid):
+            for key in self.table.keys:
+                # Convert key to row data
+                columns_str = ", ".join(key.columns) if key.columns else ""
+                ref_columns_str = ", ".join(key.referenced_columns) if key.referenced_columns else ""
 
-            # Calculate has_index based on associated_index_guid
-            # The GUID is the single source of truth - don't automatically re-link by columns
-            has_index = False
-            if key.associated_index_guid:
-                # Check if the associated index still exists
-                for idx in self.table.indexes:
-                    if idx.guid == key.associated_index_guid:
-                        has_index = True
-                        break
+                # Calculate has_index based on associated_index_guid
+                # The GUID is the single source of truth - don't automatically re-link by columns
+                has_index = False
+                if key.associated_index_guid:
+                    # Check if the associated index still exists
+                    for idx in self.table.indexes:
+                        if idx.guid == key.associated_index_guid:
+                            has_index = True
+                            break
 
-                # If index doesn't exist anymore, clear the stale GUID
-                if not has_index:
-                    key.associated_index_guid = None
-
-            row_data = [
-                key.name,
-                key.key_type,  # Will match the data value in combobox
-                columns_str,
-                key.referenced_table or "",
-                ref_columns_str,
-                key.on_delete or "",
-                has_index  # Calculated from existing indexes
-            ]
+                    # If index doesn't exist anymore, clear the stale GUID
+                    if not has_index:
+                        key.associated_index_guid = None
+
+                row_data = [
+                    key.name,
+                    key.key_type,  # Will match the data value in combobox
+                    columns_str,
+                    key.referenced_table or "",
+                    ref_columns_str,
+                    key.on_delete or "",
+                    has_index  # Calculated from existing indexes
+                ]
+
+                rows.append(row_data)
 
-            self.keys_grid.add_row(row_data)
+            self.keys_grid.add_rows(rows)
 
         # After loading all keys, update the Columns comboboxes with current table's columns
         available_columns = self._get_available_columns()
@@ -872,17 +970,16 @@ class TableDialog(QDialog):
         self.indexes_grid.clear_data()
 
         # Add indexes from table
-        for index in self.table.indexes:
-            # Convert index to row data
-            columns_str = ", ".join(index.columns) if index.columns else ""
-
-            row_data = [
-                index.name,
-                columns_str,
-                index.tablespace or ""
-            ]
-
-            self.indexes_grid.add_row(row_data)
+        with self._bulk_grid_update(self.indexes_grid):
+            # Convert indexes to row data
+            self.indexes_grid.add_rows([
+                [
+                    index.name,
+                    ", ".join(index.columns) if index.columns else "",
+                    index.tablespace or ""
+                ]
+                for index in self.table.indexes
+            ])
 
         # After loading all indexes, update the Columns comboboxes with current table's columns
         available_columns = self._get_available_columns()
@@ -897,44 +994,32 @@ class TableDialog(QDialog):
                 if current_value:
                     columns_widget.setCurrentText(current_value)
 
+    def _on_columns_cell_changed(self, row, col):
+        """Route Domain cell changes (column 5) to the domain handler."""
+        if col == 5:
+            domain_item = self.columns_grid.get_cell_item(row, 5)
+            self._on_domain_changed(row, domain_item.data(Qt.ItemDataRole.UserRole) if domain_item else None)
+
     def _on_domain_changed(self, row, domain_name):
         """Handle domain selection change for a column."""
+        # Data type editability is re-evaluated on paint; repaint the cell for it
+        self.columns_grid.refresh_cell(row, 1)
+
         if not domain_name:  # Empty domain selected
-            # Make data type editable
-            self._update_data_type_editability(row, "")
             return
 
         # Find the domain and set its data type
-        if self.project and hasattr(self.project, 'domains'):
-            domain = next((d for d in self.project.domains if d.name == domain_name), None)
-            if domain:
-                # Set data type from domain
-                data_type_item = self.columns_grid.get_cell_item(row, 1)
-                if data_type_item:
-                    data_type_item.setText(domain.data_type)
-
-                # Make data type non-editable
-                self._update_data_type_editability(row, domain_name)
-
-    def _update_data_type_editability(self, row, domain_name):
-        """Update whether the data type cell is editable based on domain selection."""
-        data_type_item = self.columns_grid.get_cell_item(row, 1)
-        if data_type_item:
-            if domain_name:  # Domain selected
-                # Make non-editable with gray text
-                data_type_item.setFlags(data_type_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                data_type_item.setForeground(QColor(128, 128, 128))  # Gray text color
-            else:  # No domain selected
-                # Make editable with default system text color
-                data_type_item.setFlags(data_type_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                # Reset to default text color (matches other columns automatically)
-                data_type_item.setData(Qt.ItemDataRole.ForegroundRole, None)
-
-    def _on_stereotype_changed(self, row, stereotype_name):
-        """Handle stereotype selection change for a single row."""
-        # Stereotype doesn't affect other columns, just store the selection
-        # The value will be read when saving the table
-        pass
+        domain = self._domains_by_name.get(domain_name)
+        if domain:
+            # Set data type from domain
+            data_type_item = self.columns_grid.get_cell_item(row, 1)
+            if data_type_item:
+                data_type_item.setText(domain.data_type)
+
+    def _is_data_type_editable(self, row):
+        """Return False when the row's data type is bound to a selected domain."""
+        domain_item = self.columns_grid.get_cell_item(row, 5)
+        return not (domain_item and domain_item.data(Qt.ItemDataRole.UserRole))
 
     def _setup_key_cell(self, row: int, col: int, value):
         """Custom cell setup for keys grid to auto-generate names."""
@@ -954,7 +1039,7 @@ class TableDialog(QDialog):
                 # Get columns from column 2
                 columns_item = self.keys_grid.get_cell_item(row, 2)
                 columns_str = columns_item.text() if columns_item else ""
-                columns = [c.strip() for c in columns_str.split(',') if c.strip()]
+                columns = _split_column_list(columns_str)
 
                 # Get referenced table for foreign keys
                 referenced_table_item = self.keys_grid.get_cell_item(row, 3)
@@ -1017,14 +1102,15 @@ class TableDialog(QDialog):
             if tablespace_combo and isinstance(tablespace_combo, QComboBox):
                 # Get current owner's default index tablespace
                 current_owner = self.owner_combo.currentText()
-                if current_owner and self.owners:
-                    owner = next((o for o in self.owners if o.name == current_owner), None)
+                if current_owner:
+                    owner = self._owners_by_name.get(current_owner)
                     if owner and owner.default_index_tablespace:
                         # Set to owner's default index tablespace
                         index = tablespace_combo.findText(owner.default_index_tablespace)
                         if index >= 0:
                             tablespace_combo.setCurrentIndex(index)
 
+    @Slot()
     def _add_foreign_key(self):
         """Add a new foreign key row with auto-generated name."""
         from k2core.models.base import Key
@@ -1069,6 +1155,7 @@ class TableDialog(QDialog):
 
         self.keys_grid.add_row(row_data)
 
+    @Slot()
     def _add_unique_key(self):
         """Add a new unique key row with auto-generated name."""
         from k2core.models.base import Key
@@ -1119,11 +1206,18 @@ class TableDialog(QDialog):
         self.cancel_button.clicked.connect(self.reject)
 
         self.color_button.clicked.connect(self._choose_color)
-        self.stereotype_combo.currentTextChanged.connect(self._on_table_stereotype_changed)
+
+        # Coalesce rapid stereotype changes (e.g. arrow-key scrolling) into one color update
+        self._stereotype_color_timer = QTimer(self)
+        self._stereotype_color_timer.setSingleShot(True)
+        self._stereotype_color_timer.setInterval(50)
+        self._stereotype_color_timer.timeout.connect(self._on_table_stereotype_changed)
+        self.stereotype_combo.currentTextChanged.connect(self._schedule_table_stereotype_color)
 
         # Import CSV button (not part of grid widget)
         # (already connected in _setup_columns_tab)
 
+    @Slot()
     def _import_from_csv(self):
         """Import columns from CSV data."""
         from .csv_import_dialog import CSVImportDialog
@@ -1157,17 +1251,21 @@ class TableDialog(QDialog):
                         self.columns_grid.clear_data()
 
                 # Import the columns
-                for col_data in columns:
+                with self._bulk_grid_update(self.columns_grid):
                     # col_data has: name, data_type, nullable, default, comment
-                    self.columns_grid.add_row([
-                        col_data.get('name', ''),
-                        col_data.get('data_type', ''),
-                        col_data.get('nullable', True),
-                        col_data.get('default', ''),
-                        col_data.get('comment', ''),
-                        '',  # domain
-                        ''   # stereotype
+                    self.columns_grid.add_rows([
+                        [
+                            col_data.get('name', ''),
+                            col_data.get('data_type', ''),
+                            col_data.get('nullable', True),
+                            col_data.get('default', ''),
+                            col_data.get('comment', ''),
+                            '',  # domain
+                            ''   # stereotype
+                        ]
+                        for col_data in columns
                     ])
+                self.columns_grid.data_changed.emit()
 
                 # Show success message
                 QMessageBox.information(
@@ -1177,11 +1275,20 @@ class TableDialog(QDialog):
                 )
 
 
+    @Slot()
     def _choose_color(self):
         """Open color picker dialog."""
-        current_color = QColor(self.current_color)
-        color = QColorDialog.getColor(current_color, self, "Choose Table Color")
+        dialog = self._color_dialog
+        if dialog is None:
+            dialog = QColorDialog(self)
+            dialog.setWindowTitle("Choose Table Color")
+            self._color_dialog = dialog
+
+        dialog.setCurrentColor(QColor(self.current_color))
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
 
+        color = dialog.currentColor()
         if color.isValid():
             self._set_color(color.name())
             self._color_manually_set = True
@@ -1189,35 +1296,39 @@ class TableDialog(QDialog):
     def _set_color(self, color_hex: str):
         """Set the current color and update the preview."""
         self.current_color = color_hex
-        self.color_preview.setStyleSheet(f"border: 1px solid black; background-color: {color_hex};")
-        self.color_preview.setToolTip(f"Current color: {color_hex}")
-
+        if color_hex == self._preview_color:
+            return
+        self._preview_color = color_hex
+        preview_palette = self.color_preview.palette()
+        preview_palette.setColor(QPalette.ColorRole.Window, QColor(color_hex))
+        self.color_preview.setPalette(preview_palette)
+        self.color_preview.setToolTip(self._COLOR_PREVIEW_TOOLTIP.format(color_hex))
+
+    @Slot(str)
+    def _schedule_table_stereotype_color(self, _text):
+        """Restart the debounce timer; the color is applied once it fires."""
+        self._stereotype_color_timer.start()
+
+    @Slot()
     def _on_table_stereotype_changed(self, text=None):
         """Handle table stereotype change to update default color."""
         # Auto-update color based on stereotype if color hasn't been manually set
-        if not self.is_edit_mode or not hasattr(self, '_color_manually_set'):
+        if not self.is_edit_mode or not self._color_manually_set:
             # Only auto-update color if not in edit mode or color hasn't been manually set
             stereotype_name = text if text is not None else self.stereotype_combo.currentText()
+            if stereotype_name == self._last_table_stereotype:
+                return
+            self._last_table_stereotype = stereotype_name
 
-            if stereotype_name and self.project and hasattr(self.project, 'stereotypes'):
-                # Find the stereotype in project stereotypes
-                stereotype = None
-                for s in self.project.stereotypes:
-                    if s.name == stereotype_name and s.stereotype_type == StereotypeType.TABLE:
-                        stereotype = s
-                        break
-
-                if stereotype:
-                    self._set_color(stereotype.background_color)
-                else:
-                    # Default color if stereotype not found
-                    self._set_color("#464646")
-            else:
-                # Default color for empty stereotype
-                self._set_color("#464646")
+            # Default color for an empty or unknown stereotype
+            self._set_color(self._table_stereotype_colors.get(stereotype_name, self._DEFAULT_TABLE_COLOR))
 
+    @Slot(int)
     def _on_tab_changed(self, index):
         """Handle tab change event to sync between Keys and Indexes tabs."""
+        if index == 1:  # Switching TO Columns tab
+            self._ensure_columns_loaded()
+
         # Check if we're switching to the Keys tab (index 2: Basic=0, Columns=1, Keys=2, Indexes=3)
         if index == 2:  # Switching TO Keys tab
             # Always sync keys from indexes when entering Keys tab
@@ -1328,11 +1439,18 @@ class TableDialog(QDialog):
         except Exception as e:
             logger.exception("Error syncing keys from indexes: %s", e)
 
+    @Slot()
     def _on_ok(self):
         """Handle OK button click."""
-        if not self._validate_form():
+        column_rows = self._read_column_rows()
+        if not self._validate_form(column_rows):
             return
 
+        # Apply a stereotype color change that is still waiting on the debounce timer
+        if self._stereotype_color_timer.isActive():
+            self._stereotype_color_timer.stop()
+            self._on_table_stereotype_changed()
+
         name = self.name_edit.text().strip()
         owner = self.owner_combo.currentText()
         tablespace = self.tablespace_edit.text().strip() or None
@@ -1352,7 +1470,7 @@ class TableDialog(QDialog):
             self.table.comment = comment
 
             # Update columns
-            self._update_table_columns()
+            self._update_table_columns(column_rows)
 
             # Update keys
             self._update_table_keys()
@@ -1372,7 +1490,7 @@ class TableDialog(QDialog):
             )
 
             # Add columns
-            self._update_table_columns()
+            self._update_table_columns(column_rows)
 
             # Add keys
             self._update_table_keys()
@@ -1380,9 +1498,9 @@ class TableDialog(QDialog):
             # Add indexes
             self._update_table_indexes()
 
-        # Refresh active diagram if it exists
-        self._refresh_active_diagram()
-
+        # Refresh active diagram if it exists and the table actually changed
+        if self._table_changed():
+            self._refresh_active_diagram()
 
         self.accept()
 
@@ -1395,36 +1513,76 @@ class TableDialog(QDialog):
         # Call parent's reject to close the dialog
         super().reject()
 
-    def _update_table_columns(self):
-        """Update table columns from the grid widget."""
-        if not self.table:
-            return
+    def _read_column_rows(self) -> list:
+        """Read the columns grid once, with name and data type stripped and data type interned."""
+        if not self._columns_loaded:
+            return []
 
         # Commit any active editor before reading data
         self.columns_grid.commit_active_editor()
 
-        # Clear existing columns
-        self.table.columns.clear()
+        rows = []
+        for name, data_type, *rest in self.columns_grid.get_all_data():
+            name = name.strip() if isinstance(name, str) else str(name)
+            # Data types repeat across columns; share one string per distinct type
+            data_type = intern(data_type.strip() if isinstance(data_type, str) else str(data_type))
+            rows.append((name, data_type, *rest))
+        return rows
 
-        # Add columns from grid widget
-        for row_data in self.columns_grid.get_all_data():
-            name, data_type, nullable, default, comment, domain, stereotype = row_data
+    def _update_table_columns(self, column_rows: list = None):
+        """Update table columns from the grid widget."""
+        if not self.table:
+            return
 
-            # Skip empty rows
-            name = name.strip() if isinstance(name, str) else str(name)
-            data_type = data_type.strip() if isinstance(data_type, str) else str(data_type)
+        if not self._columns_loaded:
+            # Columns tab never shown: columns are unchanged, only keys/indexes may be
+            self._update_table_keys()
+            self._update_table_indexes()
+            return
 
+        if column_rows is None:
+            column_rows = self._read_column_rows()
+
+        # Column fields from grid widget, skipping empty rows
+        column_fields = []
+        for name, data_type, nullable, default, comment, domain, stereotype in column_rows:
             if name and data_type:
-                column = Column(
-                    name=name,
-                    data_type=data_type,
-                    nullable=bool(nullable),
-                    default=default.strip() if default and isinstance(default, str) and default.strip() else None,
-                    comment=comment.strip() if comment and isinstance(comment, str) and comment.strip() else None,
-                    domain=domain if domain else None,
-                    stereotype=stereotype if stereotype else None
-                )
-                self.table.add_column(column)
+                column_fields.append({
+                    'name': name,
+                    'data_type': data_type,
+                    # Checkbox cells already yield a bool; a missing item means the default
+                    'nullable': nullable if isinstance(nullable, bool) else True,
+                    'default': (default.strip() if isinstance(default, str) else "") or None,
+                    'comment': (comment.strip() if isinstance(comment, str) else "") or None,
+                    'domain': domain if domain else None,
+                    'stereotype': stereotype if stereotype else None,
+                })
+
+        # Nothing edited: leave the existing column list untouched
+        unchanged = len(column_fields) == len(self.table.columns) and all(
+            getattr(column, field) == value
+            for column, fields in zip(self.table.columns, column_fields)
+            for field, value in fields.items()
+        )
+
+        if not unchanged:
+            # Existing columns by name: reused in place so their identity and GUID survive
+            existing_columns = {}
+            for column in self.table.columns:
+                existing_columns.setdefault(column.name, column)
+
+            columns = []
+            for fields in column_fields:
+                column = existing_columns.pop(fields['name'], None)
+                if column is None:
+                    column = Column(**fields)
+                else:
+                    for field, value in fields.items():
+                        setattr(column, field, value)
+                columns.append(column)
+
+            # Replace the contents in one step, keeping the list object itself
+            self.table.columns[:] = columns
 
         # Update keys
         self._update_table_keys()
@@ -1455,29 +1613,24 @@ class TableDialog(QDialog):
             for idx, row_data in enumerate(all_data):
                 name, key_type, columns_str, ref_table, ref_columns_str, on_delete, has_index = row_data
 
-                # Convert to strings first
-                name = str(name) if name else ""
+                # Convert to stripped strings once; empty optional values become None
+                name = str(name).strip() if name else ""
                 columns_str = str(columns_str) if columns_str else ""
-                ref_table = str(ref_table) if ref_table else ""
                 ref_columns_str = str(ref_columns_str) if ref_columns_str else ""
-                on_delete = str(on_delete) if on_delete else ""
+                ref_table = (str(ref_table).strip() if ref_table else "") or None
+                on_delete = (str(on_delete).strip() if on_delete else "") or None
                 has_index = bool(has_index)
 
                 # Parse columns
-                columns = [c.strip() for c in columns_str.split(",") if c.strip()] if columns_str else []
+                columns = _split_column_list(columns_str)
 
-                # Parse referenced columns
-                ref_columns = [c.strip() for c in ref_columns_str.split(",") if c.strip()] if ref_columns_str else []
-
-                # Clean up empty strings - keep value if it has content after stripping
-                ref_table = ref_table.strip() if ref_table and ref_table.strip() else None
-                ref_columns = ref_columns if ref_columns else None
-                on_delete = on_delete.strip() if on_delete and on_delete.strip() else None
+                # Parse referenced columns; Key expects a list, empty when there are none
+                ref_columns = _split_column_list(ref_columns_str)
 
                 # Only add keys with name and columns
-                if name.strip() and columns:
+                if name and columns:
                     key = Key(
-                        name=name.strip(),
+                        name=name,
                         columns=columns,
                         key_type=key_type,
                         referenced_table=ref_table,
@@ -1609,37 +1762,40 @@ class TableDialog(QDialog):
         for row_data in self.indexes_grid.get_all_data():
             name, columns_str, tablespace = row_data
 
-            # Convert to strings and parse columns
-            name = str(name) if name else ""
+            # Convert to stripped strings once; an empty tablespace becomes None
+            name = str(name).strip() if name else ""
             columns_str = str(columns_str) if columns_str else ""
-            tablespace = str(tablespace) if tablespace else ""
+            tablespace = (str(tablespace).strip() if tablespace else "") or None
 
             # Parse columns
-            columns = [c.strip() for c in columns_str.split(",") if c.strip()] if columns_str else []
-
-            # Clean up tablespace - keep it if it has content, otherwise None
-            tablespace = tablespace.strip() if tablespace and tablespace.strip() else None
+            columns = _split_column_list(columns_str)
 
             # Only add indexes with name and columns
             # Skip if this index is already in the list (by checking if it's a key-associated index)
-            if name.strip() and columns:
+            if name and columns:
                 # Check if an index with this name already exists (could be key-associated)
-                index_exists = any(idx.name == name.strip() for idx in self.table.indexes)
+                index_exists = any(idx.name == name for idx in self.table.indexes)
 
                 if not index_exists:
                     index = Index(
-                        name=name.strip(),
+                        name=name,
                         columns=columns,
                         tablespace=tablespace
                     )
                     self.table.add_index(index)
 
+    def _find_main_window(self):
+        """Return the MainWindow ancestor of this dialog, or None."""
+        if self._main_window is None:
+            main_window = self.parent()
+            while main_window and type(main_window).__name__ != 'MainWindow':
+                main_window = main_window.parent()
+            self._main_window = main_window
+        return self._main_window
+
     def _refresh_active_diagram(self):
         """Refresh the active diagram to show updated table structure."""
-        # Find the main window
-        main_window = self.parent()
-        while main_window and main_window.__class__.__name__ != 'MainWindow':
-            main_window = main_window.parent()
+        main_window = self._find_main_window()
 
         if main_window and hasattr(main_window, 'tab_widget'):
             # Get the current active tab
@@ -1650,7 +1806,7 @@ class TableDialog(QDialog):
                 # Refresh the diagram to show changes
                 current_tab.refresh_diagram()
 
-    def _validate_form(self) -> bool:
+    def _validate_form(self, column_rows: list = None) -> bool:
         """Validate the form data."""
         name = self.name_edit.text().strip()
         owner = self.owner_combo.currentText()
@@ -1666,26 +1822,22 @@ class TableDialog(QDialog):
             return False
 
         # Validate columns
-        for row in range(self.columns_table.rowCount()):
-            name_item = self.columns_table.item(row, 0)
-            data_type_item = self.columns_table.item(row, 1)
-
-            if name_item and name_item.text().strip():
-                if not data_type_item or not data_type_item.text().strip():
-                    QMessageBox.warning(
-                        self, "Validation Error",
-                        f"Data type is required for column '{name_item.text().strip()}'."
-                    )
-                    return False
+        if column_rows is None:
+            column_rows = self._read_column_rows()
+        for column_name, data_type, *_ in column_rows:
+            if column_name and not data_type:
+                QMessageBox.warning(
+                    self, "Validation Error",
+                    f"Data type is required for column '{column_name}'."
+                )
+                return False
 
         return True
 
     def update_table(self):
         """Update the table object and notify parent of changes."""
         # Find the main window to emit object modification signal
-        main_window = self.parent()
-        while main_window and main_window.__class__.__name__ != 'MainWindow':
-            main_window = main_window.parent()
+        main_window = self._find_main_window()
 
         if main_window and hasattr(main_window, '_on_object_modified'):
             # Notify main window that the table was modified
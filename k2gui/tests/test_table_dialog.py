@@ -0,0 +1,65 @@
+"""
+K2 Designer - Database Schema Designer
+
+Copyright (c) 2025 Karel Švejnoha
+All rights reserved.
+
+SPDX-License-Identifier: AGPL-3.0-only OR Commercial
+
+This software is dual-licensed:
+- AGPL-3.0: Free for personal use, education, research, and internal use.
+  Any modifications or derivative works must remain open-source under AGPL.
+- Commercial License: Required for closed-source products, commercial distribution,
+  SaaS deployment, or use in proprietary systems.
+
+You MAY use this project at your company internally at no cost.
+You MAY NOT sell, sublicense, or redistribute it as a proprietary product
+without a commercial agreement.
+
+For commercial licensing, contact: sheafraidh@gmail.com
+See LICENSE file for full terms.
+"""
+
+"""Tests for TableDialog column loading and saving."""
+
+import pytest
+
+from k2core.models import Column, Project, Table
+from k2core.models.domain import Domain
+from k2core.models.owner import Owner
+from k2gui.dialogs.table_dialog import TableDialog
+
+
+def _make_project(domains):
+    project = Project("P")
+    project.owners = [Owner("APP", "USERS")]
+    project.domains = domains
+    table = Table("USERS", "APP")
+    table.columns = [
+        Column(name="ID", data_type="NUMBER(10)", domain="ID_DOM"),
+        Column(name="NAME", data_type="VARCHAR2(100)", domain="DROPPED_DOM"),
+    ]
+    project.tables = [table]
+    return project, table
+
+
+@pytest.mark.parametrize(
+    "domains",
+    [
+        pytest.param([Domain("ID_DOM", "NUMBER(10)")], id="domain-combobox"),
+        pytest.param([], id="no-domains-text"),
+    ],
+)
+def test_missing_domain_is_cleared(qtbot, domains):
+    """A column domain the project no longer defines is dropped in both Domain column modes."""
+    project, table = _make_project(domains)
+    dialog = TableDialog(table=table, owners=project.owners, project=project)
+    qtbot.addWidget(dialog)
+    dialog._ensure_columns_loaded()
+
+    grid_domains = [row[5] for row in dialog.columns_grid.get_all_data()]
+    expected_id_domain = "ID_DOM" if domains else ""
+    assert grid_domains == [expected_id_domain, ""]
+
+    dialog._update_table_columns()
+    assert [column.domain for column in table.columns] == [expected_id_domain or None, None]
@@ -22,9 +22,11 @@ See LICENSE file for full terms.
 
 import logging
 from collections.abc import Callable
+from contextlib import contextmanager
 from typing import Any
 
-from PySide6.QtCore import QEvent, QItemSelection, QItemSelectionModel, QObject, Qt, QTimer, Signal
+from PySide6.QtCore import QEvent, QItemSelection, QItemSelectionModel, QObject, QSignalBlocker, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QPalette, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QAbstractItemDelegate,
     QComboBox,
@@ -43,6 +45,15 @@ from PySide6.QtWidgets import (
 
 logger = logging.getLogger(__name__)
 
+# Text color for cells rejected by a cell-editable callback
+_READ_ONLY_TEXT_COLOR = QColor(128, 128, 128)
+
+# Dynamic property naming the grid column of a cell widget, read by the shared cell slots
+_CELL_COLUMN_PROPERTY = "gridColumn"
+
+# Flags of the checkable items behind "checkbox" cells
+_CHECKABLE_ITEM_FLAGS = Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
 
 class MultiSelectDelegate(QStyledItemDelegate):
     """Custom delegate that handles multi-row editing and keyboard navigation."""
@@ -60,14 +71,58 @@ class MultiSelectDelegate(QStyledItemDelegate):
         super().__init__(parent)
         self._editing_row = -1
         self._editing_col = -1
+        # column -> callback(row) -> bool, consulted lazily on edit and paint
+        self._cell_editable_callbacks: dict[int, Callable[[int], bool]] = {}
+        # column -> item model of the combobox opened while a combobox_data_lazy cell is edited
+        self._combo_editor_models: dict[int, QStandardItemModel] = {}
+
+    def _is_cell_editable(self, index) -> bool:
+        callback = self._cell_editable_callbacks.get(index.column())
+        return callback is None or callback(index.row())
+
+    def createEditor(self, parent, option, index):
+        """Refuse to open an editor for cells rejected by a cell-editable callback.
+
+        combobox_data_lazy cells get a combobox over the column's shared item model.
+        """
+        if not self._is_cell_editable(index):
+            return None
+        model = self._combo_editor_models.get(index.column())
+        if model is not None:
+            combo = QComboBox(parent)
+            combo.setModel(model)
+            # Write a picked item to the cell at once instead of when the editor closes
+            combo.activated.connect(lambda _position, editor=combo: self.commitData.emit(editor))
+            QTimer.singleShot(0, combo, combo.showPopup)
+            return combo
+        return super().createEditor(parent, option, index)
+
+    def initStyleOption(self, option, index):
+        """Paint cells rejected by a cell-editable callback with gray text."""
+        super().initStyleOption(option, index)
+        if not self._is_cell_editable(index):
+            option.palette.setColor(QPalette.ColorRole.Text, _READ_ONLY_TEXT_COLOR)
 
     def setEditorData(self, editor, index):
         """Override to capture editing location when editing starts."""
         self._editing_row = index.row()
         self._editing_col = index.column()
         self.editingStarted.emit(index.row(), index.column())
+        if index.column() in self._combo_editor_models and isinstance(editor, QComboBox):
+            editor.setCurrentIndex(max(editor.findData(index.data(Qt.ItemDataRole.UserRole)), 0))
+            return
         super().setEditorData(editor, index)
 
+    def setModelData(self, editor, model, index):
+        """Store a combobox_data_lazy choice as display text plus data in one change."""
+        if index.column() in self._combo_editor_models and isinstance(editor, QComboBox):
+            model.setItemData(index, {
+                Qt.ItemDataRole.DisplayRole: editor.currentText(),
+                Qt.ItemDataRole.UserRole: editor.currentData(),
+            })
+            return
+        super().setModelData(editor, model, index)
+
     def eventFilter(self, editor, event):
         """Intercept Enter inside text editors: commit, close, then navigate down."""
         if event.type() == QEvent.Type.KeyPress:
@@ -101,7 +156,7 @@ class MultiSelectTableWidget(QTableWidget):
         Only updates when >= 2 rows are selected so that a plain-click
         collapsing selection to 1 row does NOT overwrite the bulk context.
         """
-        current = {item.row() for item in self.selectedItems()}
+        current = self.selected_rows()
         if len(current) >= 2:
             self._captured_selection = current
 
@@ -116,7 +171,7 @@ class MultiSelectTableWidget(QTableWidget):
           inside _captured_selection (mousePressEvent saved it before collapse).
         - Reset to single-row context otherwise.
         """
-        current = {item.row() for item in self.selectedItems()}
+        current = self.selected_rows()
         if len(current) >= 2:
             self._captured_selection = current
         elif row in self._captured_selection:
@@ -128,7 +183,7 @@ class MultiSelectTableWidget(QTableWidget):
         """Capture multi-selection BEFORE a plain click might collapse it.
 
         Qt collapses the selection to the clicked row inside super().mousePressEvent().
-        By reading selectedItems() first we can save the pre-collapse set and
+        By reading the selected rows first we can save the pre-collapse set and
         restore it as the bulk-edit context for the upcoming edit operation.
         """
         if event.button() == Qt.MouseButton.LeftButton:
@@ -136,7 +191,7 @@ class MultiSelectTableWidget(QTableWidget):
             no_modifier = not (mods & (Qt.KeyboardModifier.ControlModifier |
                                        Qt.KeyboardModifier.ShiftModifier))
             if no_modifier:
-                pre_click = {item.row() for item in self.selectedItems()}
+                pre_click = self.selected_rows()
                 clicked_row = self.indexAt(event.position().toPoint()).row()  # -1 if no index
                 if len(pre_click) > 1:
                     if clicked_row in pre_click:
@@ -192,6 +247,14 @@ class MultiSelectTableWidget(QTableWidget):
     def get_captured_selection(self) -> set[int]:
         return self._captured_selection
 
+    def selected_rows(self) -> set[int]:
+        """Return the selected row indices.
+
+        Uses one model index per selected row rather than selectedItems(),
+        which wraps every selected cell.
+        """
+        return {index.row() for index in self.selectionModel().selectedRows()}
+
     # ------------------------------------------------------------------
     # Keyboard navigation
     # ------------------------------------------------------------------
@@ -299,9 +362,13 @@ class ColumnConfig:
             name: Column display name
             width: Column width in pixels
             resize_mode: Qt resize mode (Interactive, Fixed, Stretch)
-            editor_type: Type of editor ("text", "checkbox", "checkbox_centered", "combobox", "combobox_data")
+            editor_type: Type of editor ("text", "checkbox", "checkbox_centered", "combobox", "combobox_data",
+                         "combobox_data_lazy"). combobox_data_lazy behaves like combobox_data but
+                         stores the choice in a plain item and only creates a combobox while the
+                         cell is being edited.
             editor_options: Options for editor (e.g., {'items': [...]} for combobox,
-                           {'items': [...], 'items_data': [...]} for combobox_data)
+                           {'items': [...], 'items_data': [...]} for combobox_data and
+                           combobox_data_lazy)
             filter_type: Type of filter ("text", "combobox", "none")
             filter_options: Options for filter (e.g., combobox items)
             filter_matcher: Optional callable(filter_value, cell_value) -> bool for custom
@@ -355,12 +422,21 @@ class DataGridWidget(QWidget):
         self._show_move_buttons = True
         self._custom_buttons: list[dict] = []
 
+        # Item models shared by all combobox_data cells of a column, keyed by column index
+        self._combo_models: dict[int, QStandardItemModel] = {}
+        # combobox_data_lazy columns: data value -> display text, keyed by column index
+        self._combo_texts: dict[int, dict[Any, str]] = {}
+
         # Custom callbacks
         self._add_callback: Callable | None = None
         self._edit_callback: Callable | None = None
         self._remove_callback: Callable | None = None
         self._refresh_callback: Callable | None = None
         self._cell_setup_callback: Callable | None = None
+        self._cell_editable_callbacks: dict[int, Callable[[int], bool]] = {}
+
+        # One navigation event filter shared by every cell widget
+        self._cell_widget_filter = CellWidgetEventFilter(self)
 
         # UI Components
         self.table: MultiSelectTableWidget | None = None
@@ -406,6 +482,8 @@ class DataGridWidget(QWidget):
         self._show_remove_button = show_remove_button
         self._show_move_buttons = show_move_buttons
         self._custom_buttons = custom_buttons or []
+        self._combo_models = {}
+        self._combo_texts = {}
 
         self._rebuild_ui()
 
@@ -733,6 +811,7 @@ class DataGridWidget(QWidget):
         """Build the data table."""
         self.table = MultiSelectTableWidget()
         self.table._grid = self  # back-reference for keyboard/clipboard handlers
+        self.table._delegate._cell_editable_callbacks = self._cell_editable_callbacks
         self.table.setColumnCount(len(self._columns))
         self.table.setHorizontalHeaderLabels([col.name for col in self._columns])
 
@@ -751,6 +830,13 @@ class DataGridWidget(QWidget):
         for i, col in enumerate(self._columns):
             self.table.setColumnWidth(i, col.width)
             header.setSectionResizeMode(i, col.resize_mode)
+            if col.editor_type == "combobox_data_lazy":
+                items = col.editor_options.get('items', [])
+                items_data = col.editor_options.get('items_data', items)
+                self.table._delegate._combo_editor_models[i] = self._get_combobox_data_model(i, items, items_data)
+                texts = self._combo_texts[i] = {}
+                for display_text, data_value in zip(items, items_data):
+                    texts.setdefault(data_value, display_text)
 
         # Connect main table column resize to sync with filter table
         header.sectionResized.connect(self._on_main_column_resized)
@@ -775,7 +861,7 @@ class DataGridWidget(QWidget):
         """Disable the Edit button when more than one row is selected."""
         if not self._edit_btn:
             return
-        selected = {item.row() for item in self.table.selectedItems()}
+        selected = self.table.selected_rows()
         self._edit_btn.setEnabled(len(selected) <= 1)
 
     def _handle_navigation_key(self, key: Qt.Key):
@@ -817,34 +903,58 @@ class DataGridWidget(QWidget):
     # ------------------------------------------------------------------
 
     def _on_text_cell_changed(self, row: int, col: int):
-        """Propagate a text-cell change to all other rows in _captured_selection.
+        """Propagate a text or checkbox cell change to all other rows in _captured_selection.
 
         Called via table.cellChanged, which fires whenever the view writes an
-        editor's value to the model — on Enter, Tab, or click-elsewhere commit.
+        editor's value to the model — on Enter, Tab, or click-elsewhere commit —
+        and when a checkable item is toggled.
         blockSignals(True) on the table prevents recursive cellChanged during
         propagation; it does NOT affect the selection model.
         """
         captured = self.table.get_captured_selection()
         if len(captured) <= 1 or row not in captured:
             return
-        if col >= len(self._columns) or self._columns[col].editor_type != "text":
+        if col >= len(self._columns):
+            return
+        editor_type = self._columns[col].editor_type
+        if editor_type not in ("text", "checkbox", "combobox_data_lazy"):
             return
         item = self.table.item(row, col)
         if item is None:
             return
         value = item.text()
+        check_state = item.checkState()
+        data_value = item.data(Qt.ItemDataRole.UserRole)
         self.table.blockSignals(True)
         try:
-            for r in captured:
-                if r == row:
-                    continue
-                target = self.table.item(r, col)
-                if target:
-                    target.setText(value)
+            with self._viewport_updates_suspended():
+                for r in captured:
+                    if r == row:
+                        continue
+                    target = self.table.item(r, col)
+                    if target is None:
+                        continue
+                    if editor_type == "checkbox":
+                        target.setCheckState(check_state)
+                    elif editor_type == "combobox_data_lazy":
+                        target.setText(value)
+                        target.setData(Qt.ItemDataRole.UserRole, data_value)
+                    else:
+                        target.setText(value)
         finally:
             self.table.blockSignals(False)
         self.data_changed.emit()
 
+    def _on_cell_combobox_changed(self):
+        """Slot shared by all combobox cells: propagate the sender's new selection."""
+        combo = self.sender()
+        self._propagate_combobox_change(combo, combo.property(_CELL_COLUMN_PROPERTY))
+
+    def _on_cell_checkbox_changed(self):
+        """Slot shared by all centered checkbox cells: propagate the sender's new state."""
+        checkbox = self.sender()
+        self._propagate_checkbox_change(checkbox, checkbox.property(_CELL_COLUMN_PROPERTY))
+
     def _propagate_combobox_change(self, source_widget: QComboBox, col: int):
         """Propagate a combobox selection change to all selected rows in the same column."""
         selected = self.table.get_captured_selection()
@@ -855,51 +965,62 @@ class DataGridWidget(QWidget):
             return
         data_value = source_widget.currentData()
         text_value = source_widget.currentText()
-        for r in selected:
-            if r == source_row:
-                continue
-            target = self.table.cellWidget(r, col)
-            if isinstance(target, QComboBox):
-                target.blockSignals(True)
-                # Only use findData when an explicit data value was set (not None);
-                # addItems() leaves UserRole as None, causing findData(None) to match
-                # index 0 of every item — so fall back to text matching in that case.
-                if data_value is not None:
-                    idx = target.findData(data_value)
-                    if idx >= 0:
-                        target.setCurrentIndex(idx)
-                    else:
-                        target.setCurrentText(text_value)
-                else:
-                    target.setCurrentText(text_value)
-                target.blockSignals(False)
+        with self._viewport_updates_suspended():
+            for r in selected:
+                if r == source_row:
+                    continue
+                target = self.table.cellWidget(r, col)
+                if isinstance(target, QComboBox):
+                    with QSignalBlocker(target):
+                        # Only use findData when an explicit data value was set (not None);
+                        # addItems() leaves UserRole as None, causing findData(None) to match
+                        # index 0 of every item — so fall back to text matching in that case.
+                        if data_value is not None:
+                            idx = target.findData(data_value)
+                            if idx >= 0:
+                                target.setCurrentIndex(idx)
+                            else:
+                                target.setCurrentText(text_value)
+                        else:
+                            target.setCurrentText(text_value)
         self.data_changed.emit()
 
     def _propagate_checkbox_change(self, source_cb, col: int):
         """Propagate a checkbox toggle to all selected rows in the same column."""
-        from PySide6.QtWidgets import QCheckBox
         selected = self.table.get_captured_selection()
         if len(selected) <= 1:
             return
+        # Every widget in a checkbox_centered column is the wrapper built by _setup_checkbox_centered_cell
+        source_widget = source_cb.parentWidget()
         source_row = None
         for r in range(self.table.rowCount()):
-            w = self.table.cellWidget(r, col)
-            if w and hasattr(w, "checkbox") and w.checkbox is source_cb:
+            if self.table.cellWidget(r, col) is source_widget:
                 source_row = r
                 break
         if source_row is None:
             return
         checked = source_cb.isChecked()
-        for r in selected:
-            if r == source_row:
-                continue
-            w = self.table.cellWidget(r, col)
-            if w and hasattr(w, "checkbox") and isinstance(w.checkbox, QCheckBox):
-                w.checkbox.blockSignals(True)
-                w.checkbox.setChecked(checked)
-                w.checkbox.blockSignals(False)
+        with self._viewport_updates_suspended():
+            for r in selected:
+                if r == source_row:
+                    continue
+                w = self.table.cellWidget(r, col)
+                if w is not None:
+                    with QSignalBlocker(w.checkbox):
+                        w.checkbox.setChecked(checked)
         self.data_changed.emit()
 
+    @contextmanager
+    def _viewport_updates_suspended(self):
+        """Hold back repaints of the table viewport and request a single one at the end."""
+        viewport = self.table.viewport()
+        viewport.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            viewport.setUpdatesEnabled(True)
+            viewport.update()
+
     def _find_widget_row(self, widget, col: int) -> int | None:
         """Return the row index that contains the given cell widget in the given column."""
         for r in range(self.table.rowCount()):
@@ -915,7 +1036,7 @@ class DataGridWidget(QWidget):
         """Copy selected rows to the system clipboard as TSV (Excel-compatible)."""
         from PySide6.QtWidgets import QApplication
 
-        selected_rows = sorted({item.row() for item in self.table.selectedItems()})
+        selected_rows = sorted(self.table.selected_rows())
         if not selected_rows:
             row = self.table.currentRow()
             if row >= 0:
@@ -1030,6 +1151,8 @@ class DataGridWidget(QWidget):
                     self._setup_combobox_data_cell(index, col_idx, "",
                                                    items,
                                                    col.editor_options.get("items_data", items))
+                elif col.editor_type == "combobox_data_lazy":
+                    self._setup_combobox_data_lazy_cell(index, col_idx, "")
                 if self._cell_setup_callback:
                     self._cell_setup_callback(index, col_idx, "")
         finally:
@@ -1089,15 +1212,15 @@ class DataGridWidget(QWidget):
                 # Get value based on column type
                 if widget and col_editor_type in ['checkbox_centered', 'combobox', 'combobox_data']:
                     # Get value from widget
-                    if hasattr(widget, 'checkbox'):
+                    if col_editor_type == 'checkbox_centered':
                         # Checkbox widget
-                        from PySide6.QtWidgets import QCheckBox
-                        checkbox = widget.checkbox
-                        if isinstance(checkbox, QCheckBox):
-                            cell_value = "true" if checkbox.isChecked() else "false"
+                        cell_value = "true" if widget.checkbox.isChecked() else "false"
                     elif isinstance(widget, QComboBox):
                         # Combobox widget
                         cell_value = widget.currentText().lower()
+                elif item and col_editor_type == "checkbox":
+                    # Checkable item
+                    cell_value = "true" if item.checkState() == Qt.CheckState.Checked else "false"
                 elif item:
                     # Get value from item
                     cell_value = item.text().lower()
@@ -1204,6 +1327,9 @@ class DataGridWidget(QWidget):
                     items_data = col.editor_options.get('items_data', items)
                     self._setup_combobox_data_cell(row, col_idx, str(value), items, items_data)
 
+                elif col.editor_type == "combobox_data_lazy":
+                    self._setup_combobox_data_lazy_cell(row, col_idx, str(value))
+
                 if self._cell_setup_callback:
                     self._cell_setup_callback(row, col_idx, value)
         finally:
@@ -1216,11 +1342,40 @@ class DataGridWidget(QWidget):
 
         return row
 
+    def add_rows(self, rows: list[list[Any]]):
+        """
+        Append several rows to the grid at once.
+
+        The row count is grown once and filters are applied once, so loading
+        many rows costs the same per row as loading a few.
+
+        Args:
+            rows: List of rows, where each row is a list of values for each column
+        """
+        if not rows:
+            return
+
+        first_row = self.table.rowCount()
+        self.table.setRowCount(first_row + len(rows))
+
+        # Block table signals during cell setup so cellChanged does not trigger
+        # bulk-edit propagation for programmatic initial values; the blocker
+        # restores whatever blocking state the caller had set up
+        with QSignalBlocker(self.table):
+            for row, data in enumerate(rows, first_row):
+                self._populate_row(row, data)
+
+        self._apply_filters()
+        last_row = self.table.rowCount() - 1
+        self.table.setCurrentCell(last_row, 0)
+        for row in range(first_row, last_row + 1):
+            self.row_added.emit(row)
+        self.data_changed.emit()
+
     def _setup_checkbox_cell(self, row: int, col: int, checked: bool):
         """Setup a checkbox cell."""
         item = QTableWidgetItem()
-        item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled |
-                     Qt.ItemFlag.ItemIsSelectable)
+        item.setFlags(_CHECKABLE_ITEM_FLAGS)
         item.setCheckState(Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked)
         self.table.setItem(row, col, item)
 
@@ -1245,9 +1400,10 @@ class DataGridWidget(QWidget):
 
         # Store checkbox reference for easy access
         widget.checkbox = checkbox
-        checkbox.stateChanged.connect(lambda: self._propagate_checkbox_change(checkbox, col))
+        checkbox.setProperty(_CELL_COLUMN_PROPERTY, col)
+        checkbox.stateChanged.connect(self._on_cell_checkbox_changed)
         # Let Tab/Enter navigate away instead of being swallowed by the checkbox
-        checkbox.installEventFilter(CellWidgetEventFilter(self))
+        checkbox.installEventFilter(self._cell_widget_filter)
 
     def _setup_combobox_cell(self, row: int, col: int, value: str, items: list[str], editable: bool = False):
         """Setup a combobox cell with optional editability."""
@@ -1272,9 +1428,10 @@ class DataGridWidget(QWidget):
             elif value in items:
                 combo.setCurrentText(value)
 
-        combo.currentIndexChanged.connect(lambda: self._propagate_combobox_change(combo, col))
+        combo.setProperty(_CELL_COLUMN_PROPERTY, col)
+        combo.currentIndexChanged.connect(self._on_cell_combobox_changed)
         # Let Tab/Enter navigate away instead of being swallowed by the combobox
-        combo.installEventFilter(CellWidgetEventFilter(self))
+        combo.installEventFilter(self._cell_widget_filter)
         self.table.setCellWidget(row, col, combo)
 
     def _setup_combobox_data_cell(self, row: int, col: int, value: str, items: list[str], items_data: list[str]):
@@ -1282,9 +1439,8 @@ class DataGridWidget(QWidget):
         combo = QComboBox()
         combo.setEditable(False)
 
-        # Add items with data
-        for display_text, data_value in zip(items, items_data):
-            combo.addItem(display_text, data_value)
+        # Every row of the column shares one item model
+        combo.setModel(self._get_combobox_data_model(col, items, items_data))
 
         # Set current selection by data value
         if value:
@@ -1292,11 +1448,53 @@ class DataGridWidget(QWidget):
             if index >= 0:
                 combo.setCurrentIndex(index)
 
-        combo.currentIndexChanged.connect(lambda: self._propagate_combobox_change(combo, col))
+        combo.setProperty(_CELL_COLUMN_PROPERTY, col)
+        combo.currentIndexChanged.connect(self._on_cell_combobox_changed)
         # Let Tab/Enter navigate away instead of being swallowed by the combobox
-        combo.installEventFilter(CellWidgetEventFilter(self))
+        combo.installEventFilter(self._cell_widget_filter)
         self.table.setCellWidget(row, col, combo)
 
+    def _get_combobox_data_model(self, col: int, items: list[str], items_data: list[str]) -> QStandardItemModel:
+        """Return the item model shared by the combobox_data cells of a column.
+
+        The model is built once per configured column; cells must not add or
+        remove items through their combobox, as that would affect every row.
+        """
+        model = self._combo_models.get(col)
+        if model is None:
+            model = QStandardItemModel(self)
+            for display_text, data_value in zip(items, items_data):
+                item = QStandardItem(display_text)
+                item.setData(data_value, Qt.ItemDataRole.UserRole)
+                model.appendRow(item)
+            self._combo_models[col] = model
+        return model
+
+    def _combobox_data_choice(self, col: int, value: Any) -> tuple[Any, str] | None:
+        """Return (data value, display text) of a combobox_data_lazy item matching value.
+
+        Matches by data value first and display text second, like findData/setCurrentText
+        on a combobox; None when nothing matches.
+        """
+        texts = self._combo_texts.get(col, {})
+        if value in texts:
+            return value, texts[value]
+        for data_value, display_text in texts.items():
+            if display_text == value:
+                return data_value, display_text
+        return None
+
+    def _setup_combobox_data_lazy_cell(self, row: int, col: int, value: str):
+        """Setup a combobox_data_lazy cell: a plain item holding display text and data value."""
+        choice = self._combobox_data_choice(col, value)
+        if choice is None:
+            # Unknown value: fall back to the first item, as a combobox would
+            choice = next(iter(self._combo_texts.get(col, {}).items()), ("", ""))
+        data_value, display_text = choice
+        item = QTableWidgetItem(display_text)
+        item.setData(Qt.ItemDataRole.UserRole, data_value)
+        self.table.setItem(row, col, item)
+
     def remove_selected_rows(self, confirm: bool = True) -> list[int]:
         """
         Remove all selected rows.
@@ -1307,9 +1505,7 @@ class DataGridWidget(QWidget):
         Returns:
             List of removed row indices
         """
-        selected_rows = set()
-        for item in self.table.selectedItems():
-            selected_rows.add(item.row())
+        selected_rows = self.table.selected_rows()
 
         if not selected_rows:
             current_row = self.table.currentRow()
@@ -1344,7 +1540,7 @@ class DataGridWidget(QWidget):
 
     def _move_row_up(self):
         """Move selected row(s) up."""
-        selected_rows = sorted(set(item.row() for item in self.table.selectedItems()))
+        selected_rows = sorted(self.table.selected_rows())
 
         if not selected_rows:
             current_row = self.table.currentRow()
@@ -1395,7 +1591,7 @@ class DataGridWidget(QWidget):
 
     def _move_row_down(self):
         """Move selected row(s) down."""
-        selected_rows = sorted(set(item.row() for item in self.table.selectedItems()), reverse=True)
+        selected_rows = sorted(self.table.selected_rows(), reverse=True)
 
         if not selected_rows:
             current_row = self.table.currentRow()
@@ -1446,7 +1642,7 @@ class DataGridWidget(QWidget):
 
     def _move_row_to_top(self):
         """Move selected row(s) to the top of the table."""
-        selected_rows = sorted(set(item.row() for item in self.table.selectedItems()))
+        selected_rows = sorted(self.table.selected_rows())
 
         if not selected_rows:
             current_row = self.table.currentRow()
@@ -1485,7 +1681,7 @@ class DataGridWidget(QWidget):
 
     def _move_row_to_bottom(self):
         """Move selected row(s) to the bottom of the table."""
-        selected_rows = sorted(set(item.row() for item in self.table.selectedItems()))
+        selected_rows = sorted(self.table.selected_rows())
 
         if not selected_rows:
             current_row = self.table.currentRow()
@@ -1550,6 +1746,9 @@ class DataGridWidget(QWidget):
                 items_data = col.editor_options.get('items_data', items)
                 self._setup_combobox_data_cell(row, col_idx, str(value), items, items_data)
 
+            elif col.editor_type == "combobox_data_lazy":
+                self._setup_combobox_data_lazy_cell(row, col_idx, str(value))
+
             # Allow custom cell setup
             if self._cell_setup_callback:
                 self._cell_setup_callback(row, col_idx, value)
@@ -1591,12 +1790,9 @@ class DataGridWidget(QWidget):
 
             if widget and use_widget:
                 # Check for centered checkbox widget
-                if hasattr(widget, 'checkbox'):
-                    from PySide6.QtWidgets import QCheckBox
-                    checkbox = widget.checkbox
-                    if isinstance(checkbox, QCheckBox):
-                        data.append(checkbox.isChecked())
-                        continue
+                if col_editor_type == 'checkbox_centered':
+                    data.append(widget.checkbox.isChecked())
+                    continue
 
                 # Check for combobox widget
                 if isinstance(widget, QComboBox):
@@ -1617,6 +1813,8 @@ class DataGridWidget(QWidget):
                 # For checkbox editor type (not checkbox_centered), check if it's checkable
                 if col_editor_type == "checkbox" and (item.flags() & Qt.ItemFlag.ItemIsUserCheckable):
                     data.append(item.checkState() == Qt.CheckState.Checked)
+                elif col_editor_type == "combobox_data_lazy":
+                    data.append(item.data(Qt.ItemDataRole.UserRole))
                 else:
                     # For text columns, always use text even if checkable flag is somehow set
                     data.append(item.text())
@@ -1662,12 +1860,9 @@ class DataGridWidget(QWidget):
 
             if widget and use_widget:
                 # Check for centered checkbox widget
-                if hasattr(widget, 'checkbox'):
-                    from PySide6.QtWidgets import QCheckBox
-                    checkbox = widget.checkbox
-                    if isinstance(checkbox, QCheckBox):
-                        checkbox.setChecked(bool(value))
-                        continue
+                if col_editor_type == 'checkbox_centered':
+                    widget.checkbox.setChecked(bool(value))
+                    continue
 
                 # Check for combobox widget
                 if isinstance(widget, QComboBox):
@@ -1684,12 +1879,24 @@ class DataGridWidget(QWidget):
                 # For checkbox editor type (not checkbox_centered), check if it's checkable
                 if col_editor_type == "checkbox" and (item.flags() & Qt.ItemFlag.ItemIsUserCheckable):
                     item.setCheckState(Qt.CheckState.Checked if value else Qt.CheckState.Unchecked)
+                elif col_editor_type == "combobox_data_lazy":
+                    # Values that match no item leave the cell unchanged, as on a combobox
+                    choice = self._combobox_data_choice(col, value)
+                    if choice is not None:
+                        self.table.model().setItemData(self.table.indexFromItem(item), {
+                            Qt.ItemDataRole.DisplayRole: choice[1],
+                            Qt.ItemDataRole.UserRole: choice[0],
+                        })
                 else:
                     # For text columns, always set text even if checkable flag is set
                     item.setText(str(value))
 
     def clear_data(self):
-        """Clear all rows from the grid."""
+        """Clear all rows from the grid.
+
+        Rows are dropped with a single setRowCount(0); a removeRow() loop would
+        re-lay out the remaining rows after every removal.
+        """
         self.table.setRowCount(0)
         self.table._captured_selection = set()
         self.data_changed.emit()
@@ -1758,3 +1965,20 @@ class DataGridWidget(QWidget):
         """Set custom callback for setting up cells (called after default setup)."""
         self._cell_setup_callback = callback
 
+    def set_cell_editable_callback(self, col: int, callback: Callable[[int], bool] | None):
+        """
+        Set a callback(row) -> bool deciding whether text cells of a column can be edited.
+
+        The callback is evaluated when an editor is requested and when the cell is
+        painted; rejected cells get no editor and gray text. Call refresh_cell()
+        when the callback's answer for a row changes. Pass None to remove it.
+        """
+        if callback is None:
+            self._cell_editable_callbacks.pop(col, None)
+        else:
+            self._cell_editable_callbacks[col] = callback
+
+    def refresh_cell(self, row: int, col: int):
+        """Repaint a single cell."""
+        self.table.update(self.table.model().index(row, col))
+